@@ -5,13 +5,46 @@ This module provides comprehensive error handling, user-friendly error messages,
 structured logging, and error recovery mechanisms integrated with the Result pattern.
 """
 
+import atexit
+import collections
+import functools
+import io
+import itertools
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
 import time
 import traceback
-from dataclasses import dataclass
+import types
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+# Use orjson for log payloads when available, falling back to json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 from ..core.base.result import Result
 from ..domain.exceptions.base import ErrorCode, ImageConverterError
@@ -35,7 +68,7 @@ from ..domain.exceptions.validation import (
 )
 
 
-class ErrorSeverity(Enum):
+class ErrorSeverity(str, Enum):
     """Error severity levels."""
 
     LOW = "low"
@@ -44,7 +77,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-class ErrorCategory(Enum):
+class ErrorCategory(str, Enum):
     """Error categories for better classification."""
 
     FILE_SYSTEM = "file_system"
@@ -57,7 +90,133 @@ class ErrorCategory(Enum):
     USER_INPUT = "user_input"
 
 
-@dataclass
+# Severities whose stack trace is captured and logged
+_STACK_TRACE_SEVERITIES = frozenset((ErrorSeverity.HIGH, ErrorSeverity.CRITICAL))
+
+# Logging level each severity is emitted at
+_SEVERITY_TO_LEVEL: Mapping[ErrorSeverity, int] = types.MappingProxyType(
+    {
+        ErrorSeverity.CRITICAL: logging.CRITICAL,
+        ErrorSeverity.HIGH: logging.ERROR,
+        ErrorSeverity.MEDIUM: logging.WARNING,
+        ErrorSeverity.LOW: logging.INFO,
+    }
+)
+
+# Fixed start of each severity's log message, followed by the error ID
+_SEVERITY_LOG_PREFIXES: Mapping[ErrorSeverity, str] = types.MappingProxyType(
+    {
+        ErrorSeverity.CRITICAL: "Critical error ",
+        ErrorSeverity.HIGH: "High severity error ",
+        ErrorSeverity.MEDIUM: "Medium severity error ",
+        ErrorSeverity.LOW: "Low severity error ",
+    }
+)
+
+
+class ErrorMappingEntry(NamedTuple):
+    """How an exception type is classified and presented to the user."""
+
+    category: ErrorCategory = ErrorCategory.SYSTEM
+    severity: ErrorSeverity = ErrorSeverity.MEDIUM
+    recovery_suggestions: Sequence[str] = ()
+    user_message: Optional[str] = None
+
+
+# Entry used for exception types without a mapping
+_DEFAULT_ENTRY = ErrorMappingEntry()
+
+
+def _encode_log_data(log_data: Dict[str, Any]) -> str:
+    """Serialize a structured log record to a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(log_data)
+
+
+# Separator between JSON members as emitted by _encode_log_data
+_JSON_ITEM_SEPARATOR = "," if ORJSON_AVAILABLE else ", "
+
+
+@functools.lru_cache(maxsize=None)
+def _log_data_prefix(severity: ErrorSeverity, category: ErrorCategory) -> str:
+    """Return the serialized opening of a log record.
+
+    Severity and category are fixed per exception type, so they are encoded
+    once and the per-error fields are appended after them.
+    """
+    encoded = _encode_log_data({"severity": severity, "category": category})
+    return encoded[:-1] + _JSON_ITEM_SEPARATOR
+
+
+def _slotted_dataclass(cls: type) -> type:
+    """
+    Turn a class into a dataclass whose instances have no __dict__.
+
+    Python 3.10+ does this with dataclass(slots=True); on older versions the
+    class is rebuilt with __slots__ the same way.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+
+    cls = dataclass(cls)
+    field_names = tuple(field.name for field in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    # Defaults already live in the generated __init__ and would clash with
+    # the slot descriptors
+    for name in field_names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# The default error logger and its file handler are shared by every
+# ErrorHandler in the process and installed only once
+_logger_handlers_installed = False
+_logger_setup_lock = threading.Lock()
+_logger_queue_listener: Optional[logging.handlers.QueueListener] = None
+_logger_flush_stop = threading.Event()
+
+# Newline-delimited JSON sink for error records under the default logger
+# setup; error records also go to the console, but not to the text log file
+_ndjson_log_file: Optional[io.BufferedWriter] = None
+
+# Marks log records whose error record was already written to the NDJSON sink
+_NDJSON_LOGGED_EXTRA = {"ndjson_logged": True}
+
+# Seconds between flushes of buffered error log records to the file
+_LOG_FLUSH_INTERVAL = 30.0
+
+# Log sampling per exception type: within each window the first
+# _LOG_SAMPLE_BURST errors are logged, then one in every _LOG_SAMPLE_RATE
+_LOG_SAMPLE_WINDOW = 1.0
+_LOG_SAMPLE_BURST = 10
+_LOG_SAMPLE_RATE = 100
+
+
+def _flush_log_handler_periodically(handler: logging.Handler) -> None:
+    """Flush buffered error logs every _LOG_FLUSH_INTERVAL seconds."""
+    while not _logger_flush_stop.wait(_LOG_FLUSH_INTERVAL):
+        handler.flush()
+        if _ndjson_log_file is not None:
+            _ndjson_log_file.flush()
+
+
+def _skip_ndjson_logged(record: logging.LogRecord) -> bool:
+    """Keep error records already in the NDJSON sink out of the text log."""
+    return not getattr(record, "ndjson_logged", False)
+
+
+def _stop_logger_queue_listener() -> None:
+    """Drain queued error log records to their handlers at exit."""
+    _logger_flush_stop.set()
+    if _logger_queue_listener is not None:
+        _logger_queue_listener.stop()
+    if _ndjson_log_file is not None:
+        _ndjson_log_file.flush()
+
+
+@_slotted_dataclass
 class ErrorContext:
     """Context information for errors."""
 
@@ -73,15 +232,33 @@ class ErrorContext:
     user_id: Optional[str] = None
     session_id: Optional[str] = None
     stack_trace: Optional[str] = None
-    recovery_suggestions: List[str] = None
+    recovery_suggestions: Sequence[str] = None
     metadata: Dict[str, Any] = None
 
     def __post_init__(self):
+        # Suggestions are read-only, so the empty tuple singleton is shared
         if self.recovery_suggestions is None:
-            self.recovery_suggestions = []
+            self.recovery_suggestions = ()
         if self.metadata is None:
             self.metadata = {}
 
+    def get_stack_trace(self) -> Optional[str]:
+        """
+        Get the formatted stack trace, formatting it on first access.
+
+        Nothing is captured when the error is handled; the trace is built
+        from the original exception's traceback only if someone asks for it.
+        """
+        if self.stack_trace is None:
+            exception = self.original_exception
+            if exception.__traceback__ is not None:
+                self.stack_trace = "".join(
+                    traceback.format_exception(
+                        type(exception), exception, exception.__traceback__
+                    )
+                )
+        return self.stack_trace
+
 
 class ErrorHandler:
     """
@@ -91,30 +268,97 @@ class ErrorHandler:
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize the error handler."""
         self.logger = logger or self._setup_logger()
+        # Under the default logger setup, error records go to the NDJSON error
+        # log and the console rather than the text log file; an injected
+        # logger receives them as ordinary records
+        self._ndjson_log_file = None if logger else _ndjson_log_file
         self.error_counter = 0
-        self.error_history: List[ErrorContext] = []
+        self._reset_error_ids()
         self.max_history_size = 1000
+        self.error_history: Deque[ErrorContext] = collections.deque(
+            maxlen=self.max_history_size
+        )
+
+        # Running aggregates over error_history, kept in step with the deque.
+        # Keyed by the str enum members, which equal and hash as their values.
+        self._category_counts: Counter[ErrorCategory] = collections.Counter()
+        self._severity_counts: Counter[ErrorSeverity] = collections.Counter()
+        self._recent_errors: Deque[ErrorContext] = collections.deque(
+            maxlen=self.max_history_size
+        )
 
         # Error mapping for user-friendly messages
-        self.error_mappings = self._setup_error_mappings()
+        self.error_mappings = self._compile_error_mappings(self._setup_error_mappings())
+
+        # Mappings are fixed after construction, so the MRO walk is cached
+        # per exception type for this instance
+        self._resolve_mapping = functools.lru_cache(maxsize=128)(self._find_mapping)
+
+        # Final answers of get_user_friendly_message and
+        # get_recovery_suggestions per exception type, defaults applied
+        self._user_message_by_type: Dict[type, str] = {}
+        self._suggestions_by_type: Dict[type, Tuple[str, ...]] = {}
+
+        # [errors in current window, window start] per exception type
+        self._log_samples: Dict[type, List[float]] = collections.defaultdict(
+            lambda: [0, 0.0]
+        )
+
+        # Wrapper chosen per Result error type by wrap_result_error
+        self._result_error_wrappers: Dict[type, Callable[..., Result]] = {}
 
         # Recovery strategies
         self.recovery_strategies: Dict[type, Callable] = {}
         self._setup_recovery_strategies()
+        self._resolve_recovery_strategy = functools.lru_cache(maxsize=128)(
+            self._find_recovery_strategy
+        )
 
-    def _setup_logger(self) -> logging.Logger:
+    @staticmethod
+    def _setup_logger() -> logging.Logger:
         """Set up structured logging."""
+        global _logger_handlers_installed, _logger_queue_listener, _ndjson_log_file
+
         logger = logging.getLogger("image_converter.error_handler")
-        logger.setLevel(logging.INFO)
+        if _logger_handlers_installed:
+            return logger
+
+        with _logger_setup_lock:
+            if _logger_handlers_installed or logger.handlers:
+                _logger_handlers_installed = True
+                return logger
+
+            logger.setLevel(logging.INFO)
+            os.makedirs("logs", exist_ok=True)
 
-        if not logger.handlers:
             # Console handler
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
 
-            # File handler for errors
+            # File handler for errors, buffered so that bursts of records are
+            # written in one go; ERROR and above flush the buffer immediately
             file_handler = logging.FileHandler("logs/error_handler.log")
             file_handler.setLevel(logging.WARNING)
+            buffered_file_handler = logging.handlers.MemoryHandler(
+                capacity=512,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True,
+            )
+            buffered_file_handler.setLevel(logging.WARNING)
+            buffered_file_handler.addFilter(_skip_ndjson_logged)
+
+            # Error records are appended as NDJSON through a 64 KiB buffer,
+            # flushed with the handlers; high severity records flush it at once
+            _ndjson_log_file = open("logs/error_handler.jsonl", "ab", buffering=65536)
+
+            # Quiet periods still reach the file within the flush interval
+            threading.Thread(
+                target=_flush_log_handler_periodically,
+                args=(buffered_file_handler,),
+                name="error-log-flush",
+                daemon=True,
+            ).start()
 
             # JSON formatter for structured logging
             formatter = logging.Formatter(
@@ -123,8 +367,20 @@ class ErrorHandler:
             console_handler.setFormatter(formatter)
             file_handler.setFormatter(formatter)
 
-            logger.addHandler(console_handler)
-            logger.addHandler(file_handler)
+            # Records are only enqueued on the caller's thread; formatting and
+            # file I/O happen on the listener's background thread
+            log_queue = queue.SimpleQueue()
+            _logger_queue_listener = logging.handlers.QueueListener(
+                log_queue,
+                console_handler,
+                buffered_file_handler,
+                respect_handler_level=True,
+            )
+            _logger_queue_listener.start()
+            atexit.register(_stop_logger_queue_listener)
+
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _logger_handlers_installed = True
 
         return logger
 
@@ -135,154 +391,188 @@ class ErrorHandler:
             FileNotFoundError: {
                 "category": ErrorCategory.FILE_SYSTEM,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Verify the file path is correct",
                     "Check if the file exists in the specified location",
                     "Ensure you have permission to access the file",
-                ],
+                ),
             },
             PermissionError: {
                 "category": ErrorCategory.FILE_SYSTEM,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Check file permissions",
                     "Run the application with appropriate privileges",
                     "Contact your system administrator",
-                ],
+                ),
             },
             FileSystemError: {
                 "category": ErrorCategory.FILE_SYSTEM,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Check file system permissions",
                     "Verify disk space availability",
                     "Try again with a different file location",
-                ],
+                ),
             },
             # Validation Errors
             UnsupportedFormatError: {
                 "category": ErrorCategory.VALIDATION,
                 "severity": ErrorSeverity.LOW,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Convert the file to a supported format (PNG, JPEG, WEBP, GIF, BMP)",
                     "Check the file extension matches the actual file format",
                     "Try with a different image file",
-                ],
+                ),
             },
             FileSizeError: {
                 "category": ErrorCategory.VALIDATION,
                 "severity": ErrorSeverity.LOW,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Reduce the file size",
                     "Compress the image before processing",
                     "Check the maximum allowed file size",
-                ],
+                ),
             },
             ValidationError: {
                 "category": ErrorCategory.VALIDATION,
                 "severity": ErrorSeverity.LOW,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Check input parameters",
                     "Verify file format and content",
                     "Review the validation requirements",
-                ],
+                ),
             },
             # Processing Errors
             CorruptedFileError: {
                 "category": ErrorCategory.PROCESSING,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Try with a different image file",
                     "Re-download or re-create the image file",
                     "Check if the file was properly transferred",
-                ],
+                ),
             },
             ConversionError: {
                 "category": ErrorCategory.PROCESSING,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Try with a different image file",
                     "Check if the image file is valid",
                     "Reduce image size or complexity",
-                ],
+                ),
             },
             ProcessingError: {
                 "category": ErrorCategory.PROCESSING,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Retry the operation",
                     "Check system resources",
                     "Try with a simpler image",
-                ],
+                ),
             },
             # Security Errors
             SecurityThreatDetectedError: {
                 "category": ErrorCategory.SECURITY,
                 "severity": ErrorSeverity.HIGH,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Scan the file with antivirus software",
                     "Use a different, trusted image file",
                     "Contact support if you believe this is a false positive",
-                ],
+                ),
             },
             SecurityError: {
                 "category": ErrorCategory.SECURITY,
                 "severity": ErrorSeverity.HIGH,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Review security settings",
                     "Use trusted files only",
                     "Contact security team if needed",
-                ],
+                ),
             },
             # Cache Errors
             CacheWriteError: {
                 "category": ErrorCategory.CACHE,
                 "severity": ErrorSeverity.LOW,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Clear the application cache",
                     "Check available disk space",
                     "Restart the application if the problem persists",
-                ],
+                ),
             },
             CacheReadError: {
                 "category": ErrorCategory.CACHE,
                 "severity": ErrorSeverity.LOW,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Clear the application cache",
                     "Check cache file permissions",
                     "Restart the application if the problem persists",
-                ],
+                ),
             },
             CacheError: {
                 "category": ErrorCategory.CACHE,
                 "severity": ErrorSeverity.LOW,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Clear the application cache",
                     "Check available disk space",
                     "Restart the application if the problem persists",
-                ],
+                ),
             },
             # Queue Errors
             ProcessingQueueFullError: {
                 "category": ErrorCategory.SYSTEM,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Wait a few moments and try again",
                     "Process fewer files at once",
                     "Check system resources",
-                ],
+                ),
             },
             QueueError: {
                 "category": ErrorCategory.SYSTEM,
                 "severity": ErrorSeverity.MEDIUM,
-                "recovery_suggestions": [
+                "recovery_suggestions": (
                     "Retry the operation",
                     "Check system status",
                     "Contact support if the problem persists",
-                ],
+                ),
             },
         }
 
+    @staticmethod
+    def _compile_error_mappings(
+        mappings: Dict[Type[Exception], Dict[str, Any]],
+    ) -> Mapping[Type[Exception], ErrorMappingEntry]:
+        """Build an entry for each mapping and freeze the result.
+
+        User messages and suggestion strings are interned, and identical
+        suggestion tuples are shared between entries. Every ErrorContext of
+        a type references its entry's tuple, so it must not be mutated.
+        """
+        suggestions_pool: Dict[tuple, tuple] = {}
+        compiled = {}
+        for error_type, mapping in mappings.items():
+            entry = ErrorMappingEntry(**mapping)
+            suggestions = tuple(map(sys.intern, entry.recovery_suggestions))
+            user_message = entry.user_message
+            if user_message is not None:
+                user_message = sys.intern(user_message)
+            compiled[error_type] = entry._replace(
+                recovery_suggestions=suggestions_pool.setdefault(
+                    suggestions, suggestions
+                ),
+                user_message=user_message,
+            )
+        return types.MappingProxyType(compiled)
+
+    def _find_mapping(self, error_type: type) -> ErrorMappingEntry:
+        """Find the mapping for an exception type, falling back to its bases."""
+        for cls in error_type.__mro__:
+            entry = self.error_mappings.get(cls)
+            if entry is not None:
+                return entry
+        return _DEFAULT_ENTRY
+
     def _setup_recovery_strategies(self):
         """Set up automatic recovery strategies for different error types."""
         self.recovery_strategies = {
@@ -293,6 +583,14 @@ class ErrorHandler:
             QueueError: self._recover_from_queue_error,
         }
 
+    def _find_recovery_strategy(self, error_type: type) -> Optional[Callable]:
+        """Find the recovery strategy for an exception type or its bases."""
+        for cls in error_type.__mro__:
+            strategy = self.recovery_strategies.get(cls)
+            if strategy is not None:
+                return strategy
+        return None
+
     def handle_error(
         self,
         exception: Exception,
@@ -316,26 +614,35 @@ class ErrorHandler:
         Returns:
             ErrorContext object with error details and recovery suggestions
         """
-        self.error_counter += 1
-        error_id = f"ERR_{int(time.time())}_{self.error_counter}"
+        # next() on itertools.count is atomic under the GIL, so concurrent
+        # errors never share a sequence number
+        timestamp = time.time()
+        self.error_counter = next(self._error_ids)
+        error_id = f"{self._error_id_prefix}{self.error_counter:x}"
 
         # Get error mapping
         error_type = type(exception)
-        mapping = self.error_mappings.get(error_type, {})
+        entry = self._resolve_mapping(error_type)
 
-        # Extract user message from domain exception if available
-        user_message = mapping.get("user_message")
-        if isinstance(exception, ImageConverterError):
+        # Domain exceptions carry their own user message; most handled
+        # errors are domain errors, so try the attribute first
+        try:
             user_message = exception.user_message
-        elif user_message is None:
-            user_message = "An unexpected error occurred."
+        except AttributeError:
+            user_message = entry.user_message
+            if user_message is None:
+                user_message = "An unexpected error occurred."
+
+        # The stack trace is formatted from the exception's own traceback
+        # when it is logged, which only happens for high severities
+        severity = entry.severity
 
         # Create error context
         error_context = ErrorContext(
             error_id=error_id,
-            timestamp=time.time(),
-            severity=mapping.get("severity", ErrorSeverity.MEDIUM),
-            category=mapping.get("category", ErrorCategory.SYSTEM),
+            timestamp=timestamp,
+            severity=severity,
+            category=entry.category,
             original_exception=exception,
             user_message=user_message,
             technical_message=str(exception),
@@ -343,8 +650,7 @@ class ErrorHandler:
             operation=operation,
             user_id=user_id,
             session_id=session_id,
-            stack_trace=traceback.format_exc(),
-            recovery_suggestions=mapping.get("recovery_suggestions", []),
+            recovery_suggestions=entry.recovery_suggestions,
             metadata=metadata or {},
         )
 
@@ -354,10 +660,11 @@ class ErrorHandler:
         # Store in history
         self._store_error_history(error_context)
 
-        # Attempt recovery if strategy exists
-        if error_type in self.recovery_strategies:
+        # Attempt recovery if a strategy exists for the type or a base class
+        recovery_strategy = self._resolve_recovery_strategy(error_type)
+        if recovery_strategy is not None:
             try:
-                recovery_result = self.recovery_strategies[error_type](error_context)
+                recovery_result = recovery_strategy(error_context)
                 error_context.metadata["recovery_attempted"] = True
                 error_context.metadata["recovery_result"] = recovery_result
             except Exception as recovery_error:
@@ -370,11 +677,22 @@ class ErrorHandler:
 
     def _log_error(self, error_context: ErrorContext):
         """Log error with structured information."""
+        # Skip building and serializing the record if it would be dropped
+        severity = error_context.severity
+        level = _SEVERITY_TO_LEVEL[severity]
+        if not self.logger.isEnabledFor(level):
+            return
+
+        # Error storms of one type are sampled; history and statistics still
+        # see every error
+        if not self._should_log_sample(error_context):
+            return
+
+        # Only the per-error fields are serialized here; severity and
+        # category come from the cached prefix
         log_data = {
             "error_id": error_context.error_id,
             "timestamp": error_context.timestamp,
-            "severity": error_context.severity.value,
-            "category": error_context.category.value,
             "operation": error_context.operation,
             "file_path": error_context.file_path,
             "user_id": error_context.user_id,
@@ -383,37 +701,58 @@ class ErrorHandler:
             "metadata": error_context.metadata,
         }
 
-        # Log based on severity
-        if error_context.severity == ErrorSeverity.CRITICAL:
-            self.logger.critical(
-                f"Critical error {error_context.error_id}: {json.dumps(log_data)}"
-            )
-        elif error_context.severity == ErrorSeverity.HIGH:
-            self.logger.error(
-                f"High severity error {error_context.error_id}: {json.dumps(log_data)}"
-            )
-        elif error_context.severity == ErrorSeverity.MEDIUM:
-            self.logger.warning(
-                f"Medium severity error {error_context.error_id}: {json.dumps(log_data)}"
-            )
-        else:
-            self.logger.info(
-                f"Low severity error {error_context.error_id}: {json.dumps(log_data)}"
-            )
+        # High severity errors carry their stack trace in the same record
+        if severity in _STACK_TRACE_SEVERITIES:
+            log_data["stack_trace"] = error_context.get_stack_trace()
 
-        # Log stack trace for high severity errors
-        if error_context.severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]:
-            self.logger.error(
-                f"Stack trace for {error_context.error_id}:\n{error_context.stack_trace}"
-            )
+        payload = (
+            _log_data_prefix(severity, error_context.category)
+            + _encode_log_data(log_data)[1:]
+        )
+
+        # Lower severities only fill the file's buffer and reach disk on the
+        # periodic flush or at exit; high severity errors are flushed now
+        ndjson_log_file = self._ndjson_log_file
+        extra = None
+        if ndjson_log_file is not None:
+            ndjson_log_file.write(payload.encode("utf-8") + b"\n")
+            if severity in _STACK_TRACE_SEVERITIES:
+                ndjson_log_file.flush()
+            extra = _NDJSON_LOGGED_EXTRA
+
+        message = (
+            _SEVERITY_LOG_PREFIXES[severity] + error_context.error_id + ": " + payload
+        )
+
+        self.logger.log(level, message, extra=extra)
+
+    def _should_log_sample(self, error_context: ErrorContext) -> bool:
+        """Decide whether an error is logged under per-type sampling."""
+        sample = self._log_samples[type(error_context.original_exception)]
+        if error_context.timestamp - sample[1] > _LOG_SAMPLE_WINDOW:
+            sample[0] = 0
+            sample[1] = error_context.timestamp
+
+        sample[0] += 1
+        count = sample[0]
+        return (
+            count <= _LOG_SAMPLE_BURST
+            or (count - _LOG_SAMPLE_BURST) % _LOG_SAMPLE_RATE == 0
+        )
 
     def _store_error_history(self, error_context: ErrorContext):
         """Store error in history for analysis."""
-        self.error_history.append(error_context)
+        # The deque is bounded, so the oldest entry is dropped on append;
+        # take it out of the running counters first
+        if len(self.error_history) == self.error_history.maxlen:
+            evicted = self.error_history[0]
+            self._category_counts[evicted.category] -= 1
+            self._severity_counts[evicted.severity] -= 1
 
-        # Maintain history size limit
-        if len(self.error_history) > self.max_history_size:
-            self.error_history = self.error_history[-self.max_history_size :]
+        self.error_history.append(error_context)
+        self._category_counts[error_context.category] += 1
+        self._severity_counts[error_context.severity] += 1
+        self._recent_errors.append(error_context)
 
     def _recover_from_cache_error(self, error_context: ErrorContext) -> Dict[str, Any]:
         """Recovery strategy for cache errors."""
@@ -454,20 +793,38 @@ class ErrorHandler:
 
     def get_user_friendly_message(self, exception: Exception) -> str:
         """Get a user-friendly error message for an exception."""
-        if isinstance(exception, ImageConverterError):
+        try:
             return exception.user_message
+        except AttributeError:
+            pass
 
         error_type = type(exception)
-        mapping = self.error_mappings.get(error_type, {})
-        return mapping.get(
-            "user_message", "An unexpected error occurred. Please try again."
-        )
+        try:
+            return self._user_message_by_type[error_type]
+        except KeyError:
+            pass
+
+        user_message = self._resolve_mapping(error_type).user_message
+        if user_message is None:
+            user_message = "An unexpected error occurred. Please try again."
+        self._user_message_by_type[error_type] = user_message
+        return user_message
 
     def get_recovery_suggestions(self, exception: Exception) -> List[str]:
         """Get recovery suggestions for an exception."""
         error_type = type(exception)
-        mapping = self.error_mappings.get(error_type, {})
-        return mapping.get("recovery_suggestions", ["Contact support for assistance"])
+        try:
+            suggestions = self._suggestions_by_type[error_type]
+        except KeyError:
+            entry = self._resolve_mapping(error_type)
+            if entry is _DEFAULT_ENTRY:
+                suggestions = ("Contact support for assistance",)
+            else:
+                suggestions = entry.recovery_suggestions
+            self._suggestions_by_type[error_type] = suggestions
+
+        # Callers get their own list; the cached tuple is shared
+        return list(suggestions)
 
     def handle_with_result(
         self,
@@ -517,82 +874,112 @@ class ErrorHandler:
         if result.is_success:
             return result
 
-        # If the error is already an ErrorContext, return as is
-        if isinstance(result.error, ErrorContext):
-            return result
+        # Dispatch on the concrete error type; the isinstance checks run once
+        # per type and the chosen wrapper is remembered
+        error = result.error
+        error_type = type(error)
+        wrapper = self._result_error_wrappers.get(error_type)
+        if wrapper is None:
+            if issubclass(error_type, ErrorContext):
+                wrapper = self._keep_result_error
+            elif issubclass(error_type, Exception):
+                wrapper = self._wrap_exception_error
+            else:
+                wrapper = self._wrap_generic_error
+            self._result_error_wrappers[error_type] = wrapper
+
+        return wrapper(result, error, operation)
+
+    def _keep_result_error(
+        self, result: Result, error: ErrorContext, operation: Optional[str]
+    ) -> Result:
+        """Return a Result whose error is already an ErrorContext as is."""
+        return result
 
-        # If the error is an Exception, handle it
-        if isinstance(result.error, Exception):
-            error_context = self.handle_error(result.error, operation)
-            return Result.failure(error_context)
+    def _wrap_exception_error(
+        self, result: Result, error: Exception, operation: Optional[str]
+    ) -> Result:
+        """Handle an exception carried by a Result."""
+        return Result.failure(self.handle_error(error, operation))
 
-        # For other error types, create a generic error context
+    def _wrap_generic_error(
+        self, result: Result, error: Any, operation: Optional[str]
+    ) -> Result:
+        """Create a generic error context for non-exception errors."""
         generic_error = ImageConverterError(
-            message=str(result.error), error_code=ErrorCode.UNKNOWN_ERROR
+            message=str(error), error_code=ErrorCode.UNKNOWN_ERROR
         )
-        error_context = self.handle_error(generic_error, operation)
-        return Result.failure(error_context)
+        return Result.failure(self.handle_error(generic_error, operation))
 
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics for monitoring."""
         if not self.error_history:
             return {"total_errors": 0}
 
-        # Count by category
-        category_counts = {}
-        severity_counts = {}
-        recent_errors = []
-
-        current_time = time.time()
-        one_hour_ago = current_time - 3600
-
-        for error in self.error_history:
-            # Category counts
-            category = error.category.value
-            category_counts[category] = category_counts.get(category, 0) + 1
-
-            # Severity counts
-            severity = error.severity.value
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-
-            # Recent errors (last hour)
-            if error.timestamp > one_hour_ago:
-                recent_errors.append(
-                    {
-                        "error_id": error.error_id,
-                        "timestamp": error.timestamp,
-                        "category": category,
-                        "severity": severity,
-                        "operation": error.operation,
-                    }
-                )
+        # Drop entries that have left the one-hour window
+        one_hour_ago = time.time() - 3600
+        recent = self._recent_errors
+        while recent and recent[0].timestamp <= one_hour_ago:
+            recent.popleft()
+
+        # Last 10 recent errors, read from the newest end without copying
+        # the whole window
+        last_recent = list(itertools.islice(reversed(recent), 10))
+        last_recent.reverse()
+        recent_errors = [
+            {
+                "error_id": error.error_id,
+                "timestamp": error.timestamp,
+                "category": error.category,
+                "severity": error.severity,
+                "operation": error.operation,
+            }
+            for error in last_recent
+        ]
 
         return {
             "total_errors": len(self.error_history),
-            "category_breakdown": category_counts,
-            "severity_breakdown": severity_counts,
-            "recent_errors_count": len(recent_errors),
-            "recent_errors": recent_errors[-10:],  # Last 10 recent errors
-            "error_rate_per_hour": len(recent_errors),
+            "category_breakdown": dict(+self._category_counts),
+            "severity_breakdown": dict(+self._severity_counts),
+            "recent_errors_count": len(recent),
+            "recent_errors": recent_errors,
+            "error_rate_per_hour": len(recent),
         }
 
     def clear_error_history(self):
         """Clear error history (useful for testing or maintenance)."""
         self.error_history.clear()
+        self._category_counts.clear()
+        self._severity_counts.clear()
+        self._recent_errors.clear()
         self.error_counter = 0
+        self._reset_error_ids()
         self.logger.info("Error history cleared")
 
+    def _reset_error_ids(self):
+        """Start a new error ID sequence under the current time prefix."""
+        # Error IDs are ERR_<start time as hex>_<sequence number as hex>
+        self._error_id_prefix = f"ERR_{int(time.time()):x}_"
+        self._error_ids = itertools.count(1)
+
 
 # Global error handler instance
 _global_error_handler: Optional[ErrorHandler] = None
+_global_error_handler_lock = threading.Lock()
 
 
 def get_error_handler() -> ErrorHandler:
     """Get the global error handler instance."""
     global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = ErrorHandler()
-    return _global_error_handler
+    handler = _global_error_handler
+    if handler is None:
+        # Checked again under the lock so concurrent first calls build a
+        # single handler
+        with _global_error_handler_lock:
+            if _global_error_handler is None:
+                _global_error_handler = ErrorHandler()
+            handler = _global_error_handler
+    return handler
 
 
 def handle_error(
@@ -3,9 +3,35 @@ Factory pattern implementations for the image converter system.
 
 This package provides factory classes for creating service objects
 with proper dependency injection and configuration-based selection.
+
+The factory modules are imported on first attribute access, so importing
+one factory does not load the other's dependencies.
 """
 
-from .cache_factory import CacheFactory, HybridCacheManager
-from .service_factory import ServiceFactory
+import importlib
+from typing import Any, List
 
 __all__ = ["ServiceFactory", "CacheFactory", "HybridCacheManager"]
+
+# Submodule that defines each exported name
+_EXPORT_MODULES = {
+    "ServiceFactory": ".service_factory",
+    "CacheFactory": ".cache_factory",
+    "HybridCacheManager": ".cache_factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORT_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
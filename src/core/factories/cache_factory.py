@@ -5,17 +5,20 @@ This module provides the CacheFactory class that creates appropriate
 cache backend implementations based on configuration settings.
 """
 
+import collections
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import os
+import socket
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
 
 from ...domain.exceptions.cache import CacheError
 from ..interfaces.cache_manager import ICacheManager
-from ..services.cache_manager_service import (
-    CacheManagerService,
-    DiskCacheBackend,
-    MemoryCacheBackend,
-    RedisCacheBackend,
-)
 
 
 class CacheFactory:
@@ -42,6 +45,101 @@ class CacheFactory:
         "max_age_seconds": 3600,  # 1 hour
     }
 
+    # Cache managers already created, keyed by backend type and configuration
+    _instances: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], ICacheManager] = {}
+    _instances_lock = threading.Lock()
+
+    # Cache managers returned by create_from_config, keyed by a digest of the
+    # configuration's canonical JSON; the oldest entry is dropped when full
+    CONFIG_CACHE_MAX_ENTRIES = 32
+    _config_instances: Dict[bytes, ICacheManager] = {}
+
+    # Hybrid cache managers returned by create_hybrid_cache, keyed by the ids
+    # of their backends; the backends are stored too, keeping the ids valid
+    _hybrid_instances: Dict[
+        Tuple[int, int], Tuple[ICacheManager, ICacheManager, "HybridCacheManager"]
+    ] = {}
+
+    # Absolute paths of cache directories already created by create_disk_cache
+    _ensured_dirs: Set[str] = set()
+    _ensured_dirs_lock = threading.Lock()
+
+    # Redis reachability probes used by create_auto_cache: a reachable server
+    # is re-probed after REDIS_PROBE_TTL seconds, an unreachable one after an
+    # interval that doubles with each failure up to REDIS_PROBE_MAX_BACKOFF
+    REDIS_PROBE_TIMEOUT = 0.2
+    REDIS_PROBE_TTL = 30.0
+    REDIS_PROBE_MAX_BACKOFF = 300.0
+    # (host, port) -> (reachable, probe again at, consecutive failures)
+    _redis_probes: Dict[Tuple[str, int], Tuple[bool, float, int]] = {}
+
+    @classmethod
+    def _redis_reachable(self, host: str, port: int) -> bool:
+        """Check with a short TCP connect whether a Redis server is reachable."""
+        now = time.monotonic()
+        reachable, probe_at, failures = self._redis_probes.get(
+            (host, port), (False, 0.0, 0)
+        )
+        if now < probe_at:
+            return reachable
+
+        try:
+            with socket.create_connection((host, port), self.REDIS_PROBE_TIMEOUT):
+                pass
+        except OSError:
+            failures += 1
+            backoff = min(
+                self.REDIS_PROBE_TTL * 2 ** (failures - 1), self.REDIS_PROBE_MAX_BACKOFF
+            )
+            self._redis_probes[(host, port)] = (False, now + backoff, failures)
+            return False
+
+        self._redis_probes[(host, port)] = (True, now + self.REDIS_PROBE_TTL, 0)
+        return True
+
+    @classmethod
+    def _get_or_create_cache(
+        self, backend_type: str, config: Dict[str, Any]
+    ) -> ICacheManager:
+        """
+        Return the cache manager for a backend configuration, creating it once.
+
+        Configurations with unhashable values are not shared and get a new
+        cache manager on every call.
+        """
+        # Import here so the cache service loads on first use
+        from ..services.cache_manager_service import CacheManagerService
+
+        key = (backend_type, tuple(sorted(config.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return CacheManagerService(backend_type=backend_type, backend_config=config)
+
+        with self._instances_lock:
+            cache_manager = self._instances.get(key)
+            if cache_manager is None:
+                cache_manager = CacheManagerService(
+                    backend_type=backend_type, backend_config=config
+                )
+                self._instances[key] = cache_manager
+            return cache_manager
+
+    @classmethod
+    def clear_instance_cache(cls) -> None:
+        """
+        Forget all shared cache manager instances.
+
+        Later create_* calls build new cache managers, useful for
+        configuration changes or testing.
+        """
+        with cls._instances_lock:
+            cls._instances.clear()
+            cls._config_instances.clear()
+            cls._hybrid_instances.clear()
+        with cls._ensured_dirs_lock:
+            cls._ensured_dirs.clear()
+
     @classmethod
     def create_memory_cache(
         self, max_entries: int = 1000, max_age_seconds: int = 3600, **kwargs
@@ -49,6 +147,8 @@ class CacheFactory:
         """
         Create a memory-based cache manager.
 
+        Calls with the same configuration share one cache manager.
+
         Args:
             max_entries: Maximum number of cache entries
             max_age_seconds: Maximum age of cache entries in seconds
@@ -61,13 +161,13 @@ class CacheFactory:
             CacheError: If cache creation fails
         """
         try:
-            config = {
-                "max_entries": max_entries,
-                "max_age_seconds": max_age_seconds,
-                **kwargs,
-            }
+            # kwargs is a new dict owned by this call, so it becomes the
+            # configuration instead of being copied into another one
+            config = kwargs
+            config["max_entries"] = max_entries
+            config["max_age_seconds"] = max_age_seconds
 
-            return CacheManagerService(backend_type="memory", backend_config=config)
+            return self._get_or_create_cache("memory", config)
 
         except Exception as e:
             raise CacheError(f"Failed to create memory cache: {str(e)}")
@@ -83,6 +183,8 @@ class CacheFactory:
         """
         Create a disk-based cache manager.
 
+        Calls with the same configuration share one cache manager.
+
         Args:
             cache_dir: Directory to store cache files
             max_size_mb: Maximum cache size in megabytes
@@ -96,18 +198,20 @@ class CacheFactory:
             CacheError: If cache creation fails
         """
         try:
-            # Ensure cache directory exists
-            cache_path = Path(cache_dir)
-            cache_path.mkdir(parents=True, exist_ok=True)
+            # Ensure cache directory exists, once per directory per process
+            dir_key = os.path.abspath(cache_dir)
+            if dir_key not in self._ensured_dirs:
+                with self._ensured_dirs_lock:
+                    if dir_key not in self._ensured_dirs:
+                        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                        self._ensured_dirs.add(dir_key)
 
-            config = {
-                "cache_dir": cache_dir,
-                "max_size_mb": max_size_mb,
-                "max_age_seconds": max_age_seconds,
-                **kwargs,
-            }
+            config = kwargs
+            config["cache_dir"] = cache_dir
+            config["max_size_mb"] = max_size_mb
+            config["max_age_seconds"] = max_age_seconds
 
-            return CacheManagerService(backend_type="disk", backend_config=config)
+            return self._get_or_create_cache("disk", config)
 
         except Exception as e:
             raise CacheError(f"Failed to create disk cache: {str(e)}")
@@ -125,6 +229,8 @@ class CacheFactory:
         """
         Create a Redis-based cache manager.
 
+        Calls with the same configuration share one cache manager.
+
         Args:
             host: Redis server host
             port: Redis server port
@@ -140,18 +246,16 @@ class CacheFactory:
             CacheError: If cache creation fails or Redis is not available
         """
         try:
-            config = {
-                "host": host,
-                "port": port,
-                "db": db,
-                "max_age_seconds": max_age_seconds,
-                **kwargs,
-            }
+            config = kwargs
+            config["host"] = host
+            config["port"] = port
+            config["db"] = db
+            config["max_age_seconds"] = max_age_seconds
 
             if password:
                 config["password"] = password
 
-            return CacheManagerService(backend_type="redis", backend_config=config)
+            return self._get_or_create_cache("redis", config)
 
         except Exception as e:
             raise CacheError(f"Failed to create Redis cache: {str(e)}")
@@ -173,18 +277,48 @@ class CacheFactory:
         if not isinstance(cache_config, dict):
             raise CacheError("Cache configuration must be a dictionary")
 
-        backend_type = cache_config.get("backend_type", "memory").lower()
-
+        # Equal configurations, even in different dict objects, return the
+        # cache manager already built for them
         try:
-            if backend_type == "memory":
-                return self._create_memory_from_config(cache_config)
-            elif backend_type == "disk":
-                return self._create_disk_from_config(cache_config)
-            elif backend_type == "redis":
-                return self._create_redis_from_config(cache_config)
-            else:
+            config_key = hashlib.blake2b(
+                json.dumps(cache_config, sort_keys=True, default=str).encode(),
+                digest_size=16,
+            ).digest()
+        except (TypeError, ValueError):
+            config_key = None
+        else:
+            cache_manager = self._config_instances.get(config_key)
+            if cache_manager is not None:
+                return cache_manager
+
+        cache_manager = self._create_from_config(cache_config)
+        if config_key is not None:
+            with self._instances_lock:
+                if len(self._config_instances) >= self.CONFIG_CACHE_MAX_ENTRIES:
+                    del self._config_instances[next(iter(self._config_instances))]
+                self._config_instances[config_key] = cache_manager
+        return cache_manager
+
+    @classmethod
+    def _create_from_config(self, cache_config: Dict[str, Any]) -> ICacheManager:
+        """Build the cache manager described by a configuration dictionary."""
+        # Canonical lower-case names hit the table directly; only other
+        # spellings pay for lower()
+        backend_type = cache_config.get("backend_type", "memory")
+        backend = _BACKEND_TABLE.get(backend_type)
+        if backend is None:
+            backend_type = backend_type.lower()
+            backend = _BACKEND_TABLE.get(backend_type)
+            if backend is None:
                 raise CacheError(f"Unsupported cache backend type: {backend_type}")
 
+        defaults, builder_name = backend
+        try:
+            # The backend's section overrides its defaults without copying
+            # either dict first
+            options = collections.ChainMap(cache_config.get(backend_type, {}), defaults)
+            return getattr(self, builder_name)(**options)
+
         except Exception as e:
             raise CacheError(f"Failed to create cache from config: {str(e)}")
 
@@ -195,6 +329,10 @@ class CacheFactory:
         """
         Create a hybrid cache with primary and fallback backends.
 
+        Calls that resolve to the same pair of backends share one hybrid
+        cache manager, and with it one in-process L1 cache, so a write
+        through one of them is never hidden by another's stale L1 entry.
+
         Args:
             primary_config: Configuration for primary cache backend
             fallback_config: Configuration for fallback cache backend
@@ -209,7 +347,17 @@ class CacheFactory:
             primary_cache = self.create_from_config(primary_config)
             fallback_cache = self.create_from_config(fallback_config)
 
-            return HybridCacheManager(primary_cache, fallback_cache)
+            key = (id(primary_cache), id(fallback_cache))
+            with self._instances_lock:
+                entry = self._hybrid_instances.get(key)
+                if entry is None:
+                    entry = (
+                        primary_cache,
+                        fallback_cache,
+                        HybridCacheManager(primary_cache, fallback_cache),
+                    )
+                    self._hybrid_instances[key] = entry
+            return entry[2]
 
         except Exception as e:
             raise CacheError(f"Failed to create hybrid cache: {str(e)}")
@@ -241,8 +389,9 @@ class CacheFactory:
         Returns:
             ICacheManager with the best available backend
         """
-        # Try Redis first if host is provided
-        if redis_host:
+        # Try Redis first if host is provided and the server answers a quick
+        # connect, rather than waiting for the client's own timeout
+        if redis_host and self._redis_reachable(redis_host, redis_port):
             try:
                 return self.create_redis_cache(host=redis_host, port=redis_port)
             except CacheError:
@@ -259,29 +408,67 @@ class CacheFactory:
         # Fall back to memory cache
         return self.create_memory_cache(max_entries=max_memory_entries)
 
-    @classmethod
-    def _create_memory_from_config(self, config: Dict[str, Any]) -> ICacheManager:
-        """Create memory cache from configuration."""
-        memory_config = {**self.DEFAULT_MEMORY_CONFIG}
-        memory_config.update(config.get("memory", {}))
 
-        return self.create_memory_cache(**memory_config)
+# Defaults and CacheFactory builder for each backend type accepted by
+# create_from_config
+_BACKEND_TABLE: Dict[str, Tuple[Dict[str, Any], str]] = {
+    "memory": (CacheFactory.DEFAULT_MEMORY_CONFIG, "create_memory_cache"),
+    "disk": (CacheFactory.DEFAULT_DISK_CONFIG, "create_disk_cache"),
+    "redis": (CacheFactory.DEFAULT_REDIS_CONFIG, "create_redis_cache"),
+}
 
-    @classmethod
-    def _create_disk_from_config(self, config: Dict[str, Any]) -> ICacheManager:
-        """Create disk cache from configuration."""
-        disk_config = {**self.DEFAULT_DISK_CONFIG}
-        disk_config.update(config.get("disk", {}))
 
-        return self.create_disk_cache(**disk_config)
+# Counters kept by HybridCacheManager, in reporting order
+_HYBRID_STAT_NAMES = (
+    "l1_hits",
+    "primary_hits",
+    "fallback_hits",
+    "primary_failures",
+    "total_operations",
+)
+
 
-    @classmethod
-    def _create_redis_from_config(self, config: Dict[str, Any]) -> ICacheManager:
-        """Create Redis cache from configuration."""
-        redis_config = {**self.DEFAULT_REDIS_CONFIG}
-        redis_config.update(config.get("redis", {}))
+class _HybridStats:
+    """
+    Counters kept by HybridCacheManager, one slot attribute per name.
+
+    Each counter is an itertools.count advanced with next(), a single atomic
+    step, so concurrent increments are never lost. Reading a counter also
+    advances it, so snapshot() subtracts the reads made so far.
+    """
+
+    __slots__ = _HYBRID_STAT_NAMES + ("_reads", "_lock")
+
+    def __init__(self):
+        for name in _HYBRID_STAT_NAMES:
+            setattr(self, name, itertools.count())
+        self._reads = dict.fromkeys(_HYBRID_STAT_NAMES, 0)
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current value of each counter by name."""
+        with self._lock:
+            values = {}
+            for name in _HYBRID_STAT_NAMES:
+                values[name] = next(getattr(self, name)) - self._reads[name]
+                self._reads[name] += 1
+            return values
+
+
+class _InflightLoad:
+    """
+    Backend load of one L1 key, shared by the threads that missed it.
+
+    generation is advanced when the key is evicted, so a load that started
+    before the eviction does not put its value into L1.
+    """
+
+    __slots__ = ("lock", "generation", "users")
 
-        return self.create_redis_cache(**redis_config)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.users = 0
 
 
 class HybridCacheManager:
@@ -289,83 +476,243 @@ class HybridCacheManager:
     Hybrid cache manager that uses primary and fallback cache backends.
 
     This cache manager attempts operations on the primary cache first,
-    and falls back to the secondary cache if the primary fails.
+    and falls back to the secondary cache if the primary fails. Reads are
+    served from a small in-process cache (L1) in front of both backends,
+    and concurrent misses for the same key share a single backend read.
     """
 
-    def __init__(self, primary: ICacheManager, fallback: ICacheManager):
+    __slots__ = (
+        "_primary",
+        "_fallback",
+        "_stats",
+        "_l1",
+        "_l1_lock",
+        "_inflight",
+        "_primary_retry_at",
+        "_hedge_delay",
+        "_hedge_reads",
+        "_io_pool",
+        "_hedge_pool",
+        "_hedge_slots",
+    )
+
+    # Size and entry lifetime of the in-process L1 cache
+    L1_MAX_ENTRIES = 1024
+    L1_MAX_AGE_SECONDS = 60
+
+    # Seconds reads skip the primary backend after it fails
+    PRIMARY_COOLDOWN_SECONDS = 5.0
+
+    # Seconds a result read waits on the primary before also asking the
+    # fallback
+    HEDGE_DELAY_SECONDS = 0.005
+
+    # Worker threads for primary backend calls, started on first use
+    IO_POOL_WORKERS = 4
+
+    # Primary backend types whose reads are hedged. In-process backends have
+    # no locking, so a lookup left running after a hedge could race writes.
+    HEDGED_BACKEND_TYPES = frozenset({"redis"})
+
+    # Most primary lookups a manager runs in the background for hedged reads
+    HEDGE_POOL_WORKERS = 4
+
+    def __init__(
+        self,
+        primary: ICacheManager,
+        fallback: ICacheManager,
+        hedge_delay: float = HEDGE_DELAY_SECONDS,
+    ):
         """
         Initialize hybrid cache manager.
 
         Args:
             primary: Primary cache backend
             fallback: Fallback cache backend
+            hedge_delay: Seconds to wait for the primary's cached result
+                before querying the fallback in parallel; only used when the
+                primary is a remote backend (see HEDGED_BACKEND_TYPES)
         """
         self._primary = primary
         self._fallback = fallback
-        self._stats = {
-            "primary_hits": 0,
-            "fallback_hits": 0,
-            "primary_failures": 0,
-            "total_operations": 0,
-        }
+        self._stats = _HybridStats()
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache, trying primary first."""
-        self._stats["total_operations"] += 1
+        from ..services.cache_manager_service import MemoryCacheBackend
+
+        # L1 entries are keyed by (kind, key) so that raw values from get()
+        # and conversion results from get_cached_result() stay apart
+        self._l1 = MemoryCacheBackend(
+            max_entries=self.L1_MAX_ENTRIES, max_age_seconds=self.L1_MAX_AGE_SECONDS
+        )
+        self._l1_lock = threading.Lock()
+        self._inflight: Dict[Hashable, _InflightLoad] = {}
+
+        # Circuit breaker for reads: while open, reads go straight to the
+        # fallback; the first read after the cooldown probes the primary again
+        self._primary_retry_at = 0.0
+
+        # Writes reach both backends at once: the primary call runs on the
+        # I/O pool while the calling thread updates the fallback
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.IO_POOL_WORKERS, thread_name_prefix="hybrid-cache"
+        )
+
+        # Hedged reads run the primary lookup on a pool of their own, so
+        # writes never queue behind slow lookups. Each lookup holds a slot
+        # until it finishes; with none free, reads are not hedged.
+        self._hedge_delay = hedge_delay
+        self._hedge_reads = (
+            getattr(primary, "backend_type", None) in self.HEDGED_BACKEND_TYPES
+        )
+        self._hedge_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.HEDGE_POOL_WORKERS, thread_name_prefix="hybrid-hedge"
+        )
+        self._hedge_slots = threading.BoundedSemaphore(self.HEDGE_POOL_WORKERS)
+
+    def close(self) -> None:
+        """
+        Release resources held by this cache manager.
+
+        Waits for pending primary writes and stops the I/O pool's threads.
+        Hedged lookups still running are abandoned. The cache manager must
+        not be used after it is closed.
+        """
+        self._io_pool.shutdown(wait=True)
+        self._hedge_pool.shutdown(wait=False)
+
+    def _write_both(
+        self, method_name: str, *args: Any, count_primary_failure: bool = True
+    ) -> Tuple[Any, Any]:
+        """
+        Call a write method on both backends concurrently.
+
+        Returns:
+            Tuple of the primary and fallback results, False for a backend
+            that raised
+        """
+        primary_future = self._io_pool.submit(
+            getattr(self._primary, method_name), *args
+        )
 
         try:
-            result = self._primary.get(key)
-            if result is not None:
-                self._stats["primary_hits"] += 1
-                return result
+            fallback_result = getattr(self._fallback, method_name)(*args)
+        except Exception:
+            fallback_result = False
+
+        try:
+            primary_result = primary_future.result()
         except Exception:
-            self._stats["primary_failures"] += 1
+            primary_result = False
+            if count_primary_failure:
+                self._record_primary_failure()
+
+        return primary_result, fallback_result
+
+    def _primary_available(self) -> bool:
+        """Check whether reads should try the primary backend."""
+        return time.monotonic() >= self._primary_retry_at
+
+    def _record_primary_failure(self) -> None:
+        """Count a primary failure and open the read circuit breaker."""
+        next(self._stats.primary_failures)
+        self._primary_retry_at = time.monotonic() + self.PRIMARY_COOLDOWN_SECONDS
+
+    def _read_through(
+        self, l1_key: Hashable, loader: Callable[[str], Optional[Any]], key: str
+    ) -> Optional[Any]:
+        """Read from L1, loading a miss from the backends once per key."""
+        with self._l1_lock:
+            value = self._l1.get(l1_key)
+            if value is not None:
+                next(self._stats.l1_hits)
+                return value
+            load = self._inflight.get(l1_key)
+            if load is None:
+                load = self._inflight[l1_key] = _InflightLoad()
+            load.users += 1
+
+        try:
+            with load.lock:
+                # Another thread may have loaded the key while this one waited
+                with self._l1_lock:
+                    value = self._l1.get(l1_key)
+                    generation = load.generation
+                if value is None:
+                    value = loader(key)
+                    if value is not None:
+                        with self._l1_lock:
+                            # An eviction during the load may have made the
+                            # value stale, so it is returned but not cached
+                            if load.generation == generation:
+                                self._l1.set(l1_key, value)
+        finally:
+            with self._l1_lock:
+                load.users -= 1
+                if load.users == 0 and self._inflight.get(l1_key) is load:
+                    del self._inflight[l1_key]
+        return value
+
+    def _evict_l1(self, key: str) -> None:
+        """Drop both L1 entries for a key and cancel caching of their loads."""
+        with self._l1_lock:
+            for l1_key in (("value", key), ("result", key)):
+                self._l1.delete(l1_key)
+                load = self._inflight.get(l1_key)
+                if load is not None:
+                    load.generation += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache, trying L1, then primary, then fallback."""
+        next(self._stats.total_operations)
+        return self._read_through(("value", key), self._get_from_backends, key)
+
+    def _get_from_backends(self, key: str) -> Optional[Any]:
+        """Get value from the backends, trying primary first."""
+        primary_available = self._primary_available()
+        if primary_available:
+            try:
+                result = self._primary.get(key)
+                if result is not None:
+                    next(self._stats.primary_hits)
+                    return result
+            except Exception:
+                self._record_primary_failure()
+                primary_available = False
 
         try:
             result = self._fallback.get(key)
             if result is not None:
-                self._stats["fallback_hits"] += 1
+                next(self._stats.fallback_hits)
                 # Store in primary cache for future access
-                try:
-                    self._primary.set(key, result)
-                except Exception:
-                    pass  # Ignore primary cache failures
+                if primary_available:
+                    try:
+                        self._primary.set(key, result)
+                    except Exception:
+                        pass  # Ignore primary cache failures
             return result
         except Exception:
             return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in both caches."""
-        primary_success = False
-        fallback_success = False
-
-        try:
-            primary_success = self._primary.set(key, value, ttl)
-        except Exception:
-            self._stats["primary_failures"] += 1
-
-        try:
-            fallback_success = self._fallback.set(key, value, ttl)
-        except Exception:
-            pass
-
+        self._evict_l1(key)
+        if value is not None:
+            # The L1 copy expires no later than the backends' entries
+            with self._l1_lock:
+                self._l1.set(
+                    ("value", key),
+                    value,
+                    min(ttl, self.L1_MAX_AGE_SECONDS) if ttl else None,
+                )
+
+        primary_success, fallback_success = self._write_both("set", key, value, ttl)
         return primary_success or fallback_success
 
     def invalidate(self, key: str) -> bool:
         """Invalidate key in both caches."""
-        primary_success = False
-        fallback_success = False
-
-        try:
-            primary_success = self._primary.invalidate(key)
-        except Exception:
-            self._stats["primary_failures"] += 1
-
-        try:
-            fallback_success = self._fallback.invalidate(key)
-        except Exception:
-            pass
+        self._evict_l1(key)
 
+        primary_success, fallback_success = self._write_both("invalidate", key)
         return primary_success or fallback_success
 
     def get_cache_key(self, file_path: str, options: Optional[Any] = None) -> str:
@@ -376,14 +723,81 @@ class HybridCacheManager:
             return self._fallback.get_cache_key(file_path, options)
 
     def get_cached_result(self, cache_key: str) -> Optional[Any]:
-        """Get cached result, trying primary first."""
+        """Get cached result, trying L1, then primary, then fallback."""
+        return self._read_through(
+            ("result", cache_key), self._get_cached_result_from_backends, cache_key
+        )
+
+    def _get_cached_result_from_backends(self, cache_key: str) -> Optional[Any]:
+        """
+        Get cached result from the backends, trying primary first.
+
+        For a remote primary, if it has not answered within the hedge delay,
+        the fallback is read on the calling thread and a hit is returned
+        without waiting for the primary. Other primaries, and remote ones
+        while every hedge slot is taken, are read on the calling thread.
+        """
+        if not self._primary_available():
+            return self._get_fallback_cached_result(cache_key)
+
+        if not self._hedge_reads:
+            try:
+                result = self._primary.get_cached_result(cache_key)
+            except Exception:
+                self._record_primary_failure()
+                return self._get_fallback_cached_result(cache_key)
+            if result is not None:
+                return result
+            return self._get_fallback_cached_result(cache_key)
+
+        if not self._hedge_slots.acquire(blocking=False):
+            # Every hedge worker is waiting on a slow primary, so try the
+            # fallback first and only then wait on the primary
+            result = self._get_fallback_cached_result(cache_key)
+            if result is not None:
+                return result
+            try:
+                return self._primary.get_cached_result(cache_key)
+            except Exception:
+                self._record_primary_failure()
+                return None
+
+        primary_future = self._hedge_pool.submit(
+            self._primary.get_cached_result, cache_key
+        )
+        primary_future.add_done_callback(self._release_hedge_slot)
         try:
-            result = self._primary.get_cached_result(cache_key)
+            result = primary_future.result(timeout=self._hedge_delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        except Exception:
+            self._record_primary_failure()
+            return self._get_fallback_cached_result(cache_key)
+        else:
             if result is not None:
                 return result
+            return self._get_fallback_cached_result(cache_key)
+
+        # The primary is slow: ask the fallback while its lookup runs
+        result = self._get_fallback_cached_result(cache_key)
+        if result is not None:
+            # The primary lookup lost the race and is never inspected again,
+            # so its errors are not counted
+            primary_future.cancel()
+            return result
+
+        try:
+            return primary_future.result()
         except Exception:
-            self._stats["primary_failures"] += 1
+            self._record_primary_failure()
+            return None
+
+    def _release_hedge_slot(self, future: concurrent.futures.Future) -> None:
+        """Free the hedge slot held by a finished primary lookup."""
+        self._hedge_slots.release()
 
+    def _get_fallback_cached_result(self, cache_key: str) -> Optional[Any]:
+        """Get cached result from the fallback, treating errors as a miss."""
         try:
             return self._fallback.get_cached_result(cache_key)
         except Exception:
@@ -391,27 +805,19 @@ class HybridCacheManager:
 
     def store_result(self, cache_key: str, result: Any) -> None:
         """Store result in both caches."""
-        try:
-            self._primary.store_result(cache_key, result)
-        except Exception:
-            self._stats["primary_failures"] += 1
-
-        try:
-            self._fallback.store_result(cache_key, result)
-        except Exception:
-            pass
+        # The backends store a copy of the result, so the next read reloads
+        # it rather than caching the caller's object in L1
+        self._evict_l1(cache_key)
+        self._write_both("store_result", cache_key, result)
 
     def clear_cache(self) -> None:
         """Clear both caches."""
-        try:
-            self._primary.clear_cache()
-        except Exception:
-            pass
+        with self._l1_lock:
+            self._l1.clear()
+            for load in self._inflight.values():
+                load.generation += 1
 
-        try:
-            self._fallback.clear_cache()
-        except Exception:
-            pass
+        self._write_both("clear_cache", count_primary_failure=False)
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get combined cache statistics."""
@@ -428,22 +834,18 @@ class HybridCacheManager:
         except Exception:
             fallback_stats = {"error": "Failed to get fallback stats"}
 
-        total_ops = self._stats["total_operations"]
+        hybrid_stats = self._stats.snapshot()
+        total_ops = hybrid_stats["total_operations"]
         primary_success_rate = (
-            (total_ops - self._stats["primary_failures"]) / total_ops * 100
+            (total_ops - hybrid_stats["primary_failures"]) / total_ops * 100
             if total_ops > 0
             else 0
         )
+        hybrid_stats["primary_success_rate_percent"] = round(primary_success_rate, 2)
 
         return {
             "backend_type": "hybrid",
             "primary_stats": primary_stats,
             "fallback_stats": fallback_stats,
-            "hybrid_stats": {
-                "primary_hits": self._stats["primary_hits"],
-                "fallback_hits": self._stats["fallback_hits"],
-                "primary_failures": self._stats["primary_failures"],
-                "total_operations": self._stats["total_operations"],
-                "primary_success_rate_percent": round(primary_success_rate, 2),
-            },
+            "hybrid_stats": hybrid_stats,
         }
@@ -5,17 +5,23 @@ This module provides the ServiceFactory class that creates service objects
 based on configuration and handles dependency injection.
 """
 
-from typing import Any, Dict, Optional
+import functools
+import hashlib
+import threading
+import types
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Mapping, Optional
 
 from ...domain.exceptions.base import ImageConverterError
 from ..config.app_config import AppConfig
 from ..interfaces.cache_manager import ICacheManager
 from ..interfaces.file_handler import IFileHandler
 from ..interfaces.image_converter import IImageConverter
-from ..security_validator import SecurityValidator
-from ..services.cache_manager_service import CacheManagerService
-from ..services.file_handler_service import FileHandlerService
-from ..services.image_conversion_service import ImageConversionService
+
+# Service implementations are imported where they are created, so only the
+# services actually used get loaded
+if TYPE_CHECKING:
+    from ..security_validator import SecurityValidator
+    from ..services.image_conversion_service import ImageConversionService
 
 
 class ServiceFactory:
@@ -38,9 +44,13 @@ class ServiceFactory:
         self._cache_manager: Optional[ICacheManager] = None
         self._file_handler: Optional[IFileHandler] = None
         self._image_converter: Optional[IImageConverter] = None
-        self._security_validator: Optional[SecurityValidator] = None
+        self._security_validator: Optional["SecurityValidator"] = None
+        # Allowed MIME types derived from the current config
+        self._allowed_mime_types: Optional[FrozenSet[str]] = None
+        # Serializes first-time service creation across threads
+        self._init_lock = threading.Lock()
 
-    def create_image_conversion_service(self) -> ImageConversionService:
+    def create_image_conversion_service(self) -> "ImageConversionService":
         """
         Create an ImageConversionService with all required dependencies.
 
@@ -50,6 +60,8 @@ class ServiceFactory:
         Raises:
             ImageConverterError: If service creation fails
         """
+        from ..services.image_conversion_service import ImageConversionService
+
         try:
             # Create dependencies
             converter = self.get_image_converter()
@@ -75,9 +87,7 @@ class ServiceFactory:
         Returns:
             ICacheManager implementation based on configuration
         """
-        if self._cache_manager is None:
-            self._cache_manager = self._create_cache_manager()
-        return self._cache_manager
+        return self._get_or_create("_cache_manager", self._create_cache_manager)
 
     def get_file_handler(self) -> IFileHandler:
         """
@@ -86,9 +96,7 @@ class ServiceFactory:
         Returns:
             IFileHandler implementation
         """
-        if self._file_handler is None:
-            self._file_handler = self._create_file_handler()
-        return self._file_handler
+        return self._get_or_create("_file_handler", self._create_file_handler)
 
     def get_image_converter(self) -> IImageConverter:
         """
@@ -97,20 +105,34 @@ class ServiceFactory:
         Returns:
             IImageConverter implementation
         """
-        if self._image_converter is None:
-            self._image_converter = self._create_image_converter()
-        return self._image_converter
+        return self._get_or_create("_image_converter", self._create_image_converter)
 
-    def get_security_validator(self) -> SecurityValidator:
+    def get_security_validator(self) -> "SecurityValidator":
         """
         Get or create a security validator instance.
 
         Returns:
             SecurityValidator instance configured with app settings
         """
-        if self._security_validator is None:
-            self._security_validator = self._create_security_validator()
-        return self._security_validator
+        return self._get_or_create(
+            "_security_validator", self._create_security_validator
+        )
+
+    def _get_or_create(self, attribute: str, create: Callable[[], Any]) -> Any:
+        """
+        Return the service stored in an attribute, creating it on first use.
+
+        The attribute is checked again under the lock, so concurrent first
+        calls create the service only once; later calls take no lock.
+        """
+        service = getattr(self, attribute)
+        if service is None:
+            with self._init_lock:
+                service = getattr(self, attribute)
+                if service is None:
+                    service = create()
+                    setattr(self, attribute, service)
+        return service
 
     def _create_cache_manager(self) -> ICacheManager:
         """
@@ -126,6 +148,8 @@ class ServiceFactory:
         # Determine cache backend type based on configuration
         # For now, we'll use memory cache as default, but this can be extended
         # to support different backends based on configuration
+        from ..services.cache_manager_service import CacheManagerService
+
         backend_config = {
             "max_entries": 1000,
             "max_age_seconds": self._config.cache_max_age_hours * 3600,
@@ -140,6 +164,8 @@ class ServiceFactory:
         Returns:
             IFileHandler implementation
         """
+        from ..services.file_handler_service import FileHandlerService
+
         return FileHandlerService()
 
     def _create_image_converter(self) -> IImageConverter:
@@ -156,20 +182,35 @@ class ServiceFactory:
 
         return LegacyImageConverterAdapter()
 
-    def _create_security_validator(self) -> SecurityValidator:
+    def _create_security_validator(self) -> "SecurityValidator":
         """
         Create a security validator based on configuration.
 
         Returns:
             SecurityValidator instance
         """
+        from ..security_validator import SecurityValidator
+
         return SecurityValidator(
             max_file_size=self._config.max_file_size_bytes,
-            allowed_mime_types=set(self._config.get_mime_type_mapping().values()),
+            allowed_mime_types=self._get_allowed_mime_types(),
             enable_content_scan=self._config.enable_security_scan,
             max_header_scan_size=1024,
         )
 
+    def _get_allowed_mime_types(self) -> FrozenSet[str]:
+        """
+        Get the MIME types allowed by the configuration, computed once per config.
+
+        Returns:
+            Frozen set of allowed MIME types
+        """
+        if self._allowed_mime_types is None:
+            self._allowed_mime_types = frozenset(
+                self._config.get_mime_type_mapping().values()
+            )
+        return self._allowed_mime_types
+
     def _create_no_op_cache_manager(self) -> ICacheManager:
         """
         Create a no-operation cache manager that doesn't cache anything.
@@ -177,7 +218,7 @@ class ServiceFactory:
         Returns:
             ICacheManager that performs no caching
         """
-        return NoOpCacheManager()
+        return _NOOP_CACHE_MANAGER
 
     def reset_services(self) -> None:
         """
@@ -186,10 +227,11 @@ class ServiceFactory:
         This forces recreation of services on next access,
         useful for configuration changes or testing.
         """
-        self._cache_manager = None
-        self._file_handler = None
-        self._image_converter = None
-        self._security_validator = None
+        with self._init_lock:
+            self._cache_manager = None
+            self._file_handler = None
+            self._image_converter = None
+            self._security_validator = None
 
     def update_config(self, config: AppConfig) -> None:
         """
@@ -199,6 +241,7 @@ class ServiceFactory:
             config: New application configuration
         """
         self._config = config
+        self._allowed_mime_types = None
         self.reset_services()
 
     @classmethod
@@ -228,13 +271,37 @@ class ServiceFactory:
         return cls(config)
 
 
+@functools.lru_cache(maxsize=4096)
+def _no_op_cache_key(file_path: str, options_str: str) -> str:
+    """Hash a file path and its options string into a cache key."""
+    combined = f"{file_path}:{options_str}"
+    return hashlib.md5(combined.encode()).hexdigest()
+
+
+# Statistics reported by NoOpCacheManager; they never change, so each call
+# copies this read-only template
+_NOOP_CACHE_STATS: Mapping[str, Any] = types.MappingProxyType(
+    {
+        "backend_type": "disabled",
+        "entries": 0,
+        "hits": 0,
+        "misses": 0,
+        "hit_rate_percent": 0.0,
+        "enabled": False,
+    }
+)
+
+
 class NoOpCacheManager:
     """
     No-operation cache manager that doesn't perform any caching.
 
-    This is used when caching is disabled in the configuration.
+    This is used when caching is disabled in the configuration. It holds
+    no state, so a single shared instance serves every factory.
     """
 
+    __slots__ = ()
+
     def get(self, key: str) -> Optional[Any]:
         """Always return None (cache miss)."""
         return None
@@ -249,10 +316,7 @@ class NoOpCacheManager:
 
     def get_cache_key(self, file_path: str, options: Optional[Any] = None) -> str:
         """Generate a cache key but don't use it."""
-        import hashlib
-
-        combined = f"{file_path}:{str(options) if options else ''}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        return _no_op_cache_key(file_path, str(options) if options else "")
 
     def get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Always return None (no cached result)."""
@@ -268,11 +332,8 @@ class NoOpCacheManager:
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Return stats indicating caching is disabled."""
-        return {
-            "backend_type": "disabled",
-            "entries": 0,
-            "hits": 0,
-            "misses": 0,
-            "hit_rate_percent": 0.0,
-            "enabled": False,
-        }
+        return dict(_NOOP_CACHE_STATS)
+
+
+# Shared by every ServiceFactory with caching disabled
+_NOOP_CACHE_MANAGER = NoOpCacheManager()
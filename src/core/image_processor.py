@@ -9,14 +9,31 @@ This module provides advanced image processing capabilities including:
 - Memory-optimized processing for large files
 """
 
+import contextlib
+import functools
 import gc
 import io
 import math
-from typing import List, Optional, Tuple, Union
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple, Union
 
-from PIL import Image, ImageOps
+from PIL import Image, ImageFile, ImageOps, features
 from PIL.Image import Resampling
 
+# Use simplejpeg for unoptimized RGB JPEG encodes when available
+try:
+    import numpy as np
+    import simplejpeg
+
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+    np = None
+    simplejpeg = None
+
 from ..models.models import ConversionError
 from ..models.processing_options import ProcessingOptions
 from .memory_optimizer import (
@@ -27,6 +44,135 @@ from .memory_optimizer import (
     optimized_memory_context,
 )
 
+# JPEG encoding is several times faster when Pillow is built against
+# libjpeg-turbo, as the PyPI wheels are
+LIBJPEG_TURBO_AVAILABLE = bool(features.check_feature("libjpeg_turbo"))
+if not LIBJPEG_TURBO_AVAILABLE:
+    warnings.warn(
+        "Pillow is not built with libjpeg-turbo; JPEG encoding will be slower",
+        RuntimeWarning,
+    )
+
+# Formats whose encoded size is about the raw pixel size
+_UNCOMPRESSED_FORMATS = frozenset(("BMP",))
+
+# Errors that image operations report as ConversionError. Other exceptions,
+# such as MemoryError, propagate unchanged.
+_IMAGE_ERRORS = (
+    ConversionError,
+    OSError,
+    ValueError,
+    TypeError,
+    KeyError,
+    Image.DecompressionBombError,
+)
+
+
+class _ByteCounter:
+    """
+    Write-only file object that counts the bytes written to it.
+
+    Used to measure an encoded image's size without keeping its data.
+    Seeking is not supported.
+    """
+
+    __slots__ = ("_size",)
+
+    def __init__(self):
+        self._size = 0
+
+    def write(self, data) -> int:
+        size = len(data)
+        self._size += size
+        return size
+
+    def tell(self) -> int:
+        return self._size
+
+    def flush(self) -> None:
+        pass
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        raise io.UnsupportedOperation("seek")
+
+
+# Single transpose equivalent to a clockwise rotation followed by the given
+# flips, keyed by (angle, flip_horizontal, flip_vertical). None means the
+# combination leaves the image unchanged.
+_ORIENTATION_TRANSPOSES = {
+    (0, False, False): None,
+    (0, True, False): Image.Transpose.FLIP_LEFT_RIGHT,
+    (0, False, True): Image.Transpose.FLIP_TOP_BOTTOM,
+    (0, True, True): Image.Transpose.ROTATE_180,
+    (90, False, False): Image.Transpose.ROTATE_270,
+    (90, True, False): Image.Transpose.TRANSPOSE,
+    (90, False, True): Image.Transpose.TRANSVERSE,
+    (90, True, True): Image.Transpose.ROTATE_90,
+    (180, False, False): Image.Transpose.ROTATE_180,
+    (180, True, False): Image.Transpose.FLIP_TOP_BOTTOM,
+    (180, False, True): Image.Transpose.FLIP_LEFT_RIGHT,
+    (180, True, True): None,
+    (270, False, False): Image.Transpose.ROTATE_90,
+    (270, True, False): Image.Transpose.TRANSVERSE,
+    (270, False, True): Image.Transpose.TRANSPOSE,
+    (270, True, True): Image.Transpose.ROTATE_270,
+}
+
+
+# Image modes Image.reduce supports. Others, such as "P" and the 16-bit
+# "I;16" modes, are box-resized with Image.resize instead.
+_REDUCE_MODES = frozenset(("L", "LA", "La", "RGB", "RGBA", "RGBa", "CMYK", "I", "F"))
+
+# Image modes each format saves as is, so _prepare_image_for_format can
+# return the image without converting it. Formats not listed accept any mode.
+_NATIVE_FORMAT_MODES = {
+    "JPEG": frozenset(("RGB", "L")),
+    "PNG": frozenset(("RGB", "RGBA", "L", "LA", "P")),
+    "WEBP": frozenset(("RGB", "RGBA")),
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _compression_params(
+    format_name: str, quality: int, optimize: bool
+) -> Mapping[str, object]:
+    """
+    Build format-specific compression parameters.
+
+    The result is cached per argument combination and returned as a
+    read-only mapping, so callers can pass it to save() without copying.
+    """
+    params = {}
+
+    if format_name == "JPEG":
+        params.update(
+            {
+                "quality": quality,
+                "optimize": optimize,
+                "progressive": True,
+                # 4:2:0 chroma subsampling, or 4:4:4 at high quality
+                "subsampling": 0 if quality >= 90 else 2,
+            }
+        )
+    elif format_name == "PNG":
+        # PNG compression level (0-9, where 9 is maximum compression)
+        # Map quality (1-100) to compress_level (0-9)
+        compress_level = max(0, min(9, int((100 - quality) / 11)))
+        params.update({"optimize": optimize, "compress_level": compress_level})
+    elif format_name == "WEBP":
+        params.update(
+            {
+                "quality": quality,
+                "method": 6,  # Compression method (0-6, 6 is slowest but best)
+                "optimize": optimize,
+            }
+        )
+    elif format_name in ["GIF", "BMP"]:
+        # These formats have limited compression options
+        params.update({"optimize": optimize})
+
+    return MappingProxyType(params)
+
 
 class ImageProcessor:
     """
@@ -36,13 +182,54 @@ class ImageProcessor:
     and basic editing operations on PIL Image objects.
     """
 
-    def __init__(self, enable_memory_optimization: bool = True):
-        """Initialize the ImageProcessor with default settings."""
+    # Resampling filter and reducing_gap for each resize quality. "fast"
+    # lets Pillow shrink by an integer factor with a box filter first, so
+    # LANCZOS only covers the last step of a large downscale.
+    RESIZE_METHODS = {
+        "lanczos": (Resampling.LANCZOS, None),
+        "fast": (Resampling.LANCZOS, 2.0),
+        "box": (Resampling.BOX, None),
+    }
+
+    # Quality apply_processing_options treats as "no compression requested"
+    DEFAULT_QUALITY = 85
+
+    # Output block size for Pillow's encoders. Pillow's 64 KiB default
+    # splits the output of large PNG and BMP saves into many small writes.
+    ENCODER_BLOCK_SIZE = 4 * 1024 * 1024
+
+    # Extra bytes reserved beyond the raw pixel size for file headers and
+    # palettes when pre-sizing an output buffer
+    BUFFER_RESERVE_SLACK = 2048
+
+    def __init__(
+        self,
+        enable_memory_optimization: bool = True,
+        gc_collect_interval: int = 32,
+        record_operations: bool = True,
+    ):
+        """
+        Initialize the ImageProcessor with default settings.
+
+        Args:
+            enable_memory_optimization: Whether to use buffer pooling and
+                memory monitoring
+            gc_collect_interval: Number of memory-pool compressions between
+                garbage collections
+            record_operations: Whether apply_processing_options lists each
+                applied operation in its processing info
+        """
+        # MAXBLOCK is process-wide, so only ever raise it
+        if ImageFile.MAXBLOCK < self.ENCODER_BLOCK_SIZE:
+            ImageFile.MAXBLOCK = self.ENCODER_BLOCK_SIZE
+
         # Default resampling algorithm for high-quality resizing
         self.default_resampling = Resampling.LANCZOS
 
         # Supported formats for conversion
-        self.supported_formats = {"PNG", "JPEG", "WEBP", "GIF", "BMP"}
+        self.supported_formats = frozenset({"PNG", "JPEG", "WEBP", "GIF", "BMP"})
+        # Listed in unsupported-format errors
+        self._supported_formats_list = ", ".join(sorted(self.supported_formats))
 
         # Format-specific default settings
         self.format_defaults = {
@@ -51,6 +238,9 @@ class ImageProcessor:
             "WEBP": {"quality": 85, "method": 6},
         }
 
+        # Per-operation records are only built when requested
+        self.record_operations = record_operations
+
         # Memory optimization settings
         self.enable_memory_optimization = enable_memory_optimization
         self.memory_pool = get_memory_pool() if enable_memory_optimization else None
@@ -61,6 +251,11 @@ class ImageProcessor:
             StreamingImageProcessor() if enable_memory_optimization else None
         )
 
+        # A full collection costs milliseconds, so pooled compressions only
+        # trigger one every gc_collect_interval calls
+        self.gc_collect_interval = max(1, gc_collect_interval)
+        self._pooled_compressions = 0
+
         # Memory thresholds for large file handling (in MB)
         self.large_file_threshold_mb = 50
         self.max_memory_usage_mb = 200
@@ -71,6 +266,8 @@ class ImageProcessor:
         width: Optional[int] = None,
         height: Optional[int] = None,
         maintain_aspect: bool = True,
+        resize_quality: str = "lanczos",
+        in_place: bool = False,
     ) -> Image.Image:
         """
         Resize an image with optional aspect ratio preservation.
@@ -80,9 +277,19 @@ class ImageProcessor:
             width: Target width in pixels (None to calculate from height)
             height: Target height in pixels (None to calculate from width)
             maintain_aspect: Whether to maintain the original aspect ratio
+            resize_quality: "lanczos" for the default high-quality filter,
+                "fast" to box-reduce large downscales before LANCZOS, or
+                "box" for a plain box filter (Image.reduce for exact integer
+                downscales)
+            in_place: Shrink the given image itself with Image.thumbnail
+                when the aspect ratio is kept. A JPEG that is not loaded yet
+                is then decoded at reduced scale. thumbnail rounds the
+                derived side to best match the aspect ratio, so it can
+                differ by one pixel from in_place=False. Images that would
+                be enlarged are always resized into a new image.
 
         Returns:
-            Resized PIL Image object
+            Resized PIL Image object (the given image when resized in place)
 
         Raises:
             ConversionError: If invalid dimensions are provided or resize fails
@@ -101,6 +308,11 @@ class ImageProcessor:
             raise ConversionError(
                 "At least one dimension (width or height) must be specified"
             )
+        if resize_quality not in self.RESIZE_METHODS:
+            raise ConversionError(
+                f"Invalid resize quality '{resize_quality}'. "
+                f"Valid values: {', '.join(self.RESIZE_METHODS)}"
+            )
 
         try:
             # Calculate target dimensions
@@ -114,13 +326,44 @@ class ImageProcessor:
                 target_height = height if height is not None else original_height
 
             # Perform the resize operation
-            resized_image = image.resize(
-                (target_width, target_height), self.default_resampling
-            )
+            if (
+                in_place
+                and maintain_aspect
+                and target_width <= original_width
+                and target_height <= original_height
+            ):
+                resample, reducing_gap = self.RESIZE_METHODS[resize_quality]
+                image.thumbnail(
+                    (target_width, target_height), resample, reducing_gap=reducing_gap
+                )
+                return image
+
+            if resize_quality == "lanczos":
+                resized_image = image.resize(
+                    (target_width, target_height), self.default_resampling
+                )
+            elif (
+                resize_quality == "box"
+                and image.mode in _REDUCE_MODES
+                and original_width % target_width == 0
+                and original_height % target_height == 0
+            ):
+                # An exact integer downscale with a box filter is what
+                # reduce() computes, without the general resampler
+                resized_image = image.reduce(
+                    (original_width // target_width, original_height // target_height)
+                )
+            else:
+                resample, reducing_gap = self.RESIZE_METHODS[resize_quality]
+                resized_image = image.resize(
+                    (target_width, target_height),
+                    resample,
+                    reducing_gap=reducing_gap,
+                )
 
             return resized_image
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to resize image: {str(e)}")
 
     def _calculate_aspect_ratio_dimensions(
@@ -142,27 +385,26 @@ class ImageProcessor:
         Returns:
             Tuple of (calculated_width, calculated_height)
         """
-        aspect_ratio = original_width / original_height
-
+        # Scale with integer products and floor division rather than a
+        # float aspect ratio, so results are exact and never off by one
         if target_width is not None and target_height is not None:
             # Both dimensions specified - choose the one that maintains aspect ratio
             # and fits within both constraints
-            width_based_height = int(target_width / aspect_ratio)
-            height_based_width = int(target_height * aspect_ratio)
+            width_based_height = target_width * original_height // original_width
 
             if width_based_height <= target_height:
                 return target_width, width_based_height
             else:
-                return height_based_width, target_height
+                return target_height * original_width // original_height, target_height
 
         elif target_width is not None:
             # Only width specified - calculate height
-            calculated_height = int(target_width / aspect_ratio)
+            calculated_height = target_width * original_height // original_width
             return target_width, calculated_height
 
         elif target_height is not None:
             # Only height specified - calculate width
-            calculated_width = int(target_height * aspect_ratio)
+            calculated_width = target_height * original_width // original_height
             return calculated_width, target_height
 
         # This should not happen due to validation above
@@ -181,13 +423,18 @@ class ImageProcessor:
         if image is None:
             return {}
 
+        # Read each attribute once; width, height and the transparency test
+        # all derive from size and mode
+        size = image.size
+        mode = image.mode
         return {
-            "size": image.size,
-            "width": image.width,
-            "height": image.height,
+            "size": size,
+            "width": size[0],
+            "height": size[1],
             "format": image.format,
-            "mode": image.mode,
-            "has_transparency": self._has_transparency(image),
+            "mode": mode,
+            "has_transparency": mode in ("RGBA", "LA")
+            or (mode == "P" and "transparency" in image.info),
         }
 
     def _has_transparency(self, image: Image.Image) -> bool:
@@ -204,6 +451,23 @@ class ImageProcessor:
             image.mode == "P" and "transparency" in image.info
         )
 
+    def _canonical_format(self, format_name: str) -> str:
+        """
+        Get the upper-case name of an image format.
+
+        Names already in supported_formats are returned as is, so the usual
+        upper-case spellings skip the upper() call.
+
+        Args:
+            format_name: Format name in any case
+
+        Returns:
+            Upper-case format name
+        """
+        if format_name in self.supported_formats:
+            return format_name
+        return format_name.upper()
+
     def validate_processing_options(self, options: ProcessingOptions) -> None:
         """
         Validate processing options for image operations.
@@ -231,12 +495,12 @@ class ImageProcessor:
         # Validate target format
         if (
             options.target_format
-            and options.target_format.upper() not in self.supported_formats
+            and self._canonical_format(options.target_format)
+            not in self.supported_formats
         ):
-            supported_list = ", ".join(sorted(self.supported_formats))
             raise ConversionError(
                 f"Unsupported target format '{options.target_format}'. "
-                f"Supported formats: {supported_list}"
+                f"Supported formats: {self._supported_formats_list}"
             )
 
         # Validate rotation angle
@@ -281,8 +545,15 @@ class ImageProcessor:
                 if file_size_mb < self.large_file_threshold_mb:
                     # Use regular processing for smaller files
                     with Image.open(file_path) as image:
+                        source_size = image.size
+                        self._draft_for_resize(image, options)
                         image.load()
-                        return self.apply_processing_options(image, options)
+                        processed_image, processing_info = (
+                            self.apply_processing_options(image, options)
+                        )
+                        # Report the file's size, not the draft-decoded one
+                        processing_info["original_size"] = source_size
+                        return processed_image, processing_info
 
                 # Use streaming for large files
                 def process_func(image):
@@ -307,9 +578,47 @@ class ImageProcessor:
 
                 return processed_image, processing_info
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to process large image: {str(e)}")
 
+    def _draft_for_resize(self, image: Image.Image, options: ProcessingOptions) -> None:
+        """
+        Let the JPEG decoder downscale an unloaded image that will be resized.
+
+        libjpeg can decode at 1/2, 1/4 or 1/8 scale, which is much faster
+        and uses far less memory than decoding at full size. The draft size
+        never falls below the resize target, so the final resize still does
+        the exact scaling.
+
+        Args:
+            image: Opened but not yet loaded PIL Image
+            options: Processing options that will be applied to the image
+        """
+        if image.format != "JPEG" or (
+            options.resize_width is None and options.resize_height is None
+        ):
+            return
+
+        # Resizing happens after rotation, so work in rotated orientation
+        width, height = image.size
+        rotated = options.rotation_angle in (90, 270)
+        if rotated:
+            width, height = height, width
+
+        if options.maintain_aspect_ratio:
+            target_width, target_height = self._calculate_aspect_ratio_dimensions(
+                width, height, options.resize_width, options.resize_height
+            )
+        else:
+            target_width = options.resize_width or width
+            target_height = options.resize_height or height
+
+        if rotated:
+            target_width, target_height = target_height, target_width
+
+        # Keep the mode; only the decode scale should change
+        image.draft(image.mode, (target_width, target_height))
+
     def compress_image_optimized(
         self,
         image: Image.Image,
@@ -317,6 +626,7 @@ class ImageProcessor:
         target_format: Optional[str] = None,
         optimize: bool = True,
         use_memory_pool: bool = True,
+        original_size: Optional[int] = None,
     ) -> Tuple[Image.Image, dict]:
         """
         Memory-optimized version of compress_image using buffer pooling.
@@ -327,6 +637,8 @@ class ImageProcessor:
             target_format: Target format for compression
             optimize: Whether to enable format-specific optimization
             use_memory_pool: Whether to use memory pool for buffers
+            original_size: Size of the source in bytes, if known
+                (see _get_original_size for the default)
 
         Returns:
             Tuple of (compressed_image, compression_info)
@@ -336,10 +648,12 @@ class ImageProcessor:
         """
         if self.enable_memory_optimization and use_memory_pool and self.memory_pool:
             return self._compress_with_memory_pool(
-                image, quality, target_format, optimize
+                image, quality, target_format, optimize, original_size
             )
         else:
-            return self.compress_image(image, quality, target_format, optimize)
+            return self.compress_image(
+                image, quality, target_format, optimize, original_size
+            )
 
     def _compress_with_memory_pool(
         self,
@@ -347,6 +661,7 @@ class ImageProcessor:
         quality: int,
         target_format: Optional[str],
         optimize: bool,
+        original_size: Optional[int] = None,
     ) -> Tuple[Image.Image, dict]:
         """
         Compress image using memory pool for buffer management.
@@ -356,6 +671,7 @@ class ImageProcessor:
             quality: Compression quality
             target_format: Target format
             optimize: Enable optimization
+            original_size: Size of the source in bytes, if known
 
         Returns:
             Tuple of (compressed_image, compression_info)
@@ -370,70 +686,69 @@ class ImageProcessor:
         if target_format is None:
             target_format = image.format or "PNG"
 
-        target_format = target_format.upper()
+        target_format = self._canonical_format(target_format)
         if target_format not in self.supported_formats:
-            supported_list = ", ".join(sorted(self.supported_formats))
             raise ConversionError(
                 f"Unsupported format '{target_format}'. "
-                f"Supported formats: {supported_list}"
+                f"Supported formats: {self._supported_formats_list}"
             )
 
         try:
-            # Use memory pool for buffers
-            with self.memory_pool.get_managed_buffer() as original_buffer:
-                with self.memory_pool.get_managed_buffer() as compressed_buffer:
-                    # Get original size
-                    original_format = image.format or "PNG"
-                    image.save(original_buffer, format=original_format)
-                    original_size = original_buffer.tell()
-
-                    # Prepare compression parameters
-                    save_params = self._get_compression_params(
-                        target_format, quality, optimize
-                    )
+            original_format = image.format or "PNG"
+            if original_size is None:
+                original_size = self._get_original_size(image)
+
+            # Use memory pool for the compressed output
+            with self.memory_pool.get_managed_buffer() as compressed_buffer:
+                # Prepare compression parameters
+                save_params = self._get_compression_params(
+                    target_format, quality, optimize
+                )
 
-                    # Handle format conversion if needed
-                    compressed_image = self._prepare_image_for_format(
-                        image, target_format
-                    )
+                # Handle format conversion if needed
+                compressed_image = self._prepare_image_for_format(image, target_format)
 
-                    # Compress the image
-                    compressed_image.save(
-                        compressed_buffer, format=target_format, **save_params
-                    )
-                    compressed_size = compressed_buffer.tell()
+                # Compress the image
+                compressed_image.save(
+                    compressed_buffer, format=target_format, **save_params
+                )
+                compressed_size = compressed_buffer.tell()
 
-                    # Calculate compression ratio
-                    compression_ratio = (
-                        (original_size - compressed_size) / original_size * 100
-                        if original_size > 0
-                        else 0
-                    )
+                # Calculate compression ratio
+                compression_ratio = (
+                    (original_size - compressed_size) / original_size * 100
+                    if original_size > 0
+                    else 0
+                )
 
-                    # Create compression info
-                    compression_info = {
-                        "original_size": original_size,
-                        "compressed_size": compressed_size,
-                        "compression_ratio": compression_ratio,
-                        "original_format": original_format,
-                        "target_format": target_format,
-                        "quality": quality,
-                        "optimized": optimize,
-                        "memory_pool_used": True,
-                    }
+                # Create compression info
+                compression_info = {
+                    "original_size": original_size,
+                    "compressed_size": compressed_size,
+                    "compression_ratio": compression_ratio,
+                    "original_format": original_format,
+                    "target_format": target_format,
+                    "quality": quality,
+                    "optimized": optimize,
+                    "memory_pool_used": True,
+                }
 
-                    # Load compressed image from buffer for return
-                    compressed_buffer.seek(0)
-                    result_image = Image.open(compressed_buffer)
-                    result_image.load()  # Ensure image data is loaded
+                # Load compressed image from buffer for return
+                compressed_buffer.seek(0)
+                result_image = Image.open(compressed_buffer)
+                result_image.load()  # Ensure image data is loaded
 
-                    # Trigger garbage collection to free temporary objects
-                    if self.enable_memory_optimization:
-                        get_gc_optimizer().manual_collect()
+                # Periodically collect garbage to free temporary objects
+                self._pooled_compressions += 1
+                if (
+                    self.enable_memory_optimization
+                    and self._pooled_compressions % self.gc_collect_interval == 0
+                ):
+                    get_gc_optimizer().manual_collect()
 
-                    return result_image, compression_info
+                return result_image, compression_info
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(
                 f"Failed to compress image with memory optimization: {str(e)}"
             )
@@ -445,6 +760,7 @@ class ImageProcessor:
         target_format: Optional[str] = None,
         optimize: bool = True,
         compute_original_size: bool = True,
+        original_size: Optional[int] = None,
     ) -> Tuple[io.BytesIO, dict]:
         """
         Compress an image and return the buffer directly.
@@ -454,11 +770,91 @@ class ImageProcessor:
             quality: Compression quality (1-100)
             target_format: Target format for compression
             optimize: Whether to enable format-specific optimization
-            compute_original_size: Whether to compute original size (expensive)
+            compute_original_size: Whether to report the original size;
+                when False it is reported as 0
+            original_size: Size of the source in bytes, if known
+                (see _get_original_size for the default)
 
         Returns:
             Tuple of (buffer, compression_info)
         """
+        compressed_buffer = io.BytesIO()
+        compression_info = self._compress_into(
+            compressed_buffer,
+            image,
+            quality,
+            target_format,
+            optimize,
+            compute_original_size,
+            original_size,
+        )
+        compressed_buffer.seek(0)
+        return compressed_buffer, compression_info
+
+    def compress_to_bytes(
+        self,
+        image: Image.Image,
+        quality: int = 85,
+        target_format: Optional[str] = None,
+        optimize: bool = True,
+        original_size: Optional[int] = None,
+    ) -> Tuple[bytes, dict]:
+        """
+        Compress an image and return the encoded bytes.
+
+        Unlike compress_image, the result is not decoded back into an image,
+        which saves a full decode for callers that only need the bytes.
+
+        Args:
+            image: PIL Image object to compress
+            quality: Compression quality (1-100)
+            target_format: Target format for compression
+            optimize: Whether to enable format-specific optimization
+            original_size: Size of the source in bytes, if known
+                (see _get_original_size for the default)
+
+        Returns:
+            Tuple of (compressed_bytes, compression_info)
+
+        Raises:
+            ConversionError: If compression fails or invalid parameters
+        """
+        with self._scratch_buffer() as compressed_buffer:
+            compression_info = self._compress_into(
+                compressed_buffer,
+                image,
+                quality,
+                target_format,
+                optimize,
+                original_size=original_size,
+            )
+            return compressed_buffer.getvalue(), compression_info
+
+    def _compress_into(
+        self,
+        compressed_buffer: io.BytesIO,
+        image: Image.Image,
+        quality: int,
+        target_format: Optional[str],
+        optimize: bool,
+        compute_original_size: bool = True,
+        original_size: Optional[int] = None,
+    ) -> dict:
+        """
+        Compress an image into the given buffer.
+
+        Args:
+            compressed_buffer: Empty buffer to write the compressed image to
+            image: PIL Image object to compress
+            quality: Compression quality (1-100)
+            target_format: Target format for compression
+            optimize: Whether to enable format-specific optimization
+            compute_original_size: Whether to report the original size
+            original_size: Size of the source in bytes, if known
+
+        Returns:
+            Compression info dictionary
+        """
         if image is None:
             raise ConversionError("Cannot compress None image")
 
@@ -469,58 +865,215 @@ class ImageProcessor:
         if target_format is None:
             target_format = image.format or "PNG"
 
-        target_format = target_format.upper()
+        target_format = self._canonical_format(target_format)
         if target_format not in self.supported_formats:
-            supported_list = ", ".join(sorted(self.supported_formats))
             raise ConversionError(
                 f"Unsupported format '{target_format}'. "
-                f"Supported formats: {supported_list}"
+                f"Supported formats: {self._supported_formats_list}"
             )
 
         try:
-            original_size = 0
-            original_format = image.format or "PNG"
-
-            # Get original size by saving to memory (expensive)
-            if compute_original_size:
-                original_buffer = io.BytesIO()
-                image.save(original_buffer, format=original_format)
-                original_size = original_buffer.tell()
+            if not compute_original_size:
+                original_size = 0
 
             # Prepare compression parameters
             save_params = self._get_compression_params(target_format, quality, optimize)
 
-            # Handle format conversion if needed
+            return self._encode_into(
+                compressed_buffer,
+                image,
+                target_format,
+                quality,
+                optimize,
+                save_params,
+                original_size,
+            )
+
+        except _IMAGE_ERRORS as e:
+            raise ConversionError(f"Failed to compress image: {str(e)}")
+
+    def _encode_into(
+        self,
+        compressed_buffer: io.BytesIO,
+        image: Image.Image,
+        target_format: str,
+        quality: int,
+        optimize: bool,
+        save_params: Mapping[str, object],
+        original_size: Optional[int] = None,
+        prepared_image: Optional[Image.Image] = None,
+    ) -> dict:
+        """
+        Encode an image into a buffer with already validated settings.
+
+        Args:
+            compressed_buffer: Empty buffer to write the compressed image to
+            image: PIL Image object to compress
+            target_format: Upper-case, supported target format
+            quality: Compression quality (1-100)
+            optimize: Whether format-specific optimization is enabled
+            save_params: Save parameters for the format and quality
+            original_size: Size of the source in bytes, if known
+            prepared_image: The image already prepared for target_format,
+                if the caller has it
+
+        Returns:
+            Compression info dictionary
+        """
+        original_format = image.format or "PNG"
+        if original_size is None:
+            original_size = self._get_original_size(image)
+
+        # Handle format conversion if needed
+        converted_image = prepared_image
+        if converted_image is None:
             converted_image = self._prepare_image_for_format(image, target_format)
 
-            # Compress the image
-            compressed_buffer = io.BytesIO()
-            converted_image.save(compressed_buffer, format=target_format, **save_params)
-            compressed_size = compressed_buffer.tell()
-            compressed_buffer.seek(0)
-
-            # Calculate compression ratio
-            compression_ratio = (
-                (original_size - compressed_size) / original_size * 100
-                if original_size > 0
-                else 0
-            )
+        # Compress the image
+        converted_image.save(compressed_buffer, format=target_format, **save_params)
+        compressed_size = compressed_buffer.tell()
 
-            # Create compression info
-            compression_info = {
-                "original_size": original_size,
-                "compressed_size": compressed_size,
-                "compression_ratio": compression_ratio,
-                "original_format": original_format,
-                "target_format": target_format,
-                "quality": quality,
-                "optimized": optimize,
-            }
+        # Calculate compression ratio
+        compression_ratio = (
+            (original_size - compressed_size) / original_size * 100
+            if original_size > 0
+            else 0
+        )
 
-            return compressed_buffer, compression_info
+        # Create compression info
+        return {
+            "original_size": original_size,
+            "compressed_size": compressed_size,
+            "compression_ratio": compression_ratio,
+            "original_format": original_format,
+            "target_format": target_format,
+            "quality": quality,
+            "optimized": optimize,
+        }
 
-        except Exception as e:
-            raise ConversionError(f"Failed to compress image: {str(e)}")
+    def compress_batch(
+        self,
+        images: List[Image.Image],
+        quality: int = 85,
+        target_format: Optional[str] = None,
+        optimize: bool = True,
+    ) -> List[Tuple[bytes, dict]]:
+        """
+        Compress several images with the same settings.
+
+        The settings are validated and the save parameters built once for
+        the whole batch. The images are split across threads, since Pillow's
+        encoders release the GIL, and each thread encodes into one reused
+        buffer.
+
+        Args:
+            images: PIL Image objects to compress
+            quality: Compression quality (1-100)
+            target_format: Target format (None to keep each image's format)
+            optimize: Whether to enable format-specific optimization
+
+        Returns:
+            List of (compressed_bytes, compression_info), in input order
+
+        Raises:
+            ConversionError: If any image fails to compress or invalid parameters
+        """
+        if any(image is None for image in images):
+            raise ConversionError("Cannot compress None image")
+
+        if not (1 <= quality <= 100):
+            raise ConversionError("Quality must be between 1 and 100")
+
+        # Resolve the format and save parameters for each distinct format
+        # in the batch, once
+        settings = []
+        params_by_format = {}
+        for image in images:
+            format_name = self._canonical_format(target_format or image.format or "PNG")
+            save_params = params_by_format.get(format_name)
+            if save_params is None:
+                if format_name not in self.supported_formats:
+                    raise ConversionError(
+                        f"Unsupported format '{format_name}'. "
+                        f"Supported formats: {self._supported_formats_list}"
+                    )
+                save_params = self._get_compression_params(
+                    format_name, quality, optimize
+                )
+                params_by_format[format_name] = save_params
+            settings.append((image, format_name, save_params))
+
+        # Image.save stores its parameters on the image, so an image listed
+        # twice must not be saved by two threads at once
+        max_workers = min(len(images), os.cpu_count() or 1)
+        if len({id(image) for image in images}) != len(images):
+            max_workers = 1
+
+        try:
+            if max_workers <= 1:
+                return self._compress_batch_chunk(settings, quality, optimize)
+
+            chunk_size = -(-len(settings) // max_workers)
+            chunks = []
+            for start in range(0, len(settings), chunk_size):
+                end = start + chunk_size
+                chunks.append(settings[start:end])
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                chunk_results = list(
+                    executor.map(
+                        lambda chunk: self._compress_batch_chunk(
+                            chunk, quality, optimize
+                        ),
+                        chunks,
+                    )
+                )
+            return [result for results in chunk_results for result in results]
+
+        except _IMAGE_ERRORS as e:
+            raise ConversionError(f"Failed to compress image batch: {str(e)}")
+
+    def _compress_batch_chunk(
+        self,
+        settings: List[Tuple[Image.Image, str, dict]],
+        quality: int,
+        optimize: bool,
+    ) -> List[Tuple[bytes, dict]]:
+        """
+        Compress part of a batch, reusing one buffer for every image.
+
+        Args:
+            settings: (image, target_format, save_params) for each image
+            quality: Compression quality (1-100)
+            optimize: Whether format-specific optimization is enabled
+
+        Returns:
+            List of (compressed_bytes, compression_info)
+        """
+        results = []
+        # An image listed more than once is only prepared once per format.
+        # settings holds every image for the whole call, so ids stay unique.
+        prepared_images = {}
+        with self._scratch_buffer() as buffer:
+            for image, format_name, save_params in settings:
+                key = (id(image), format_name)
+                prepared_image = prepared_images.get(key)
+                if prepared_image is None:
+                    prepared_image = self._prepare_image_for_format(image, format_name)
+                    prepared_images[key] = prepared_image
+
+                buffer.seek(0)
+                buffer.truncate(0)
+                compression_info = self._encode_into(
+                    buffer,
+                    image,
+                    format_name,
+                    quality,
+                    optimize,
+                    save_params,
+                    prepared_image=prepared_image,
+                )
+                results.append((buffer.getvalue(), compression_info))
+        return results
 
     def compress_image(
         self,
@@ -528,6 +1081,7 @@ class ImageProcessor:
         quality: int = 85,
         target_format: Optional[str] = None,
         optimize: bool = True,
+        original_size: Optional[int] = None,
     ) -> Tuple[Image.Image, dict]:
         """
         Compress an image with quality adjustment and format-specific optimization.
@@ -537,6 +1091,8 @@ class ImageProcessor:
             quality: Compression quality (1-100, higher = better quality)
             target_format: Target format for compression (JPEG, PNG, WEBP)
             optimize: Whether to enable format-specific optimization
+            original_size: Size of the source in bytes, if known
+                (see _get_original_size for the default)
 
         Returns:
             Tuple of (compressed_image, compression_info)
@@ -545,22 +1101,92 @@ class ImageProcessor:
         Raises:
             ConversionError: If compression fails or invalid parameters
         """
-        compressed_buffer, compression_info = self.compress_to_buffer(
-            image, quality, target_format, optimize
-        )
+        with self._scratch_buffer() as compressed_buffer:
+            compression_info = self._compress_into(
+                compressed_buffer,
+                image,
+                quality,
+                target_format,
+                optimize,
+                original_size=original_size,
+            )
 
-        try:
-            # Load compressed image from buffer for return
-            result_image = Image.open(compressed_buffer)
-            result_image.load()  # Ensure image data is loaded
+            try:
+                # Load compressed image from buffer for return; closing it
+                # detaches the loaded image from the buffer, which is reused
+                compressed_buffer.seek(0)
+                with Image.open(compressed_buffer) as result_image:
+                    result_image.load()
+
+                return result_image, compression_info
+            except _IMAGE_ERRORS as e:
+                raise ConversionError(f"Failed to load compressed image: {str(e)}")
+
+    def _scratch_buffer(self):
+        """
+        Get a buffer for encoded data that is not kept after the call.
+
+        Returns:
+            Context manager yielding an empty BytesIO, taken from the memory
+            pool when memory optimization is enabled
+        """
+        if self.memory_pool is not None:
+            return self.memory_pool.get_managed_buffer()
+        return contextlib.nullcontext(io.BytesIO())
+
+    def _get_original_size(self, image: Image.Image) -> int:
+        """
+        Get the size an image's compression ratio is measured against.
 
-            return result_image, compression_info
-        except Exception as e:
-            raise ConversionError(f"Failed to load compressed image: {str(e)}")
+        This is the size of the file the image was opened from, or the size
+        of its raw pixel data when there is no such file. The image is not
+        re-encoded to measure it.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            Original size in bytes
+        """
+        filename = getattr(image, "filename", None)
+        if filename:
+            try:
+                return os.path.getsize(filename)
+            except OSError:
+                pass
+
+        return image.width * image.height * len(image.getbands())
+
+    def _get_source_size(self, image: Image.Image) -> Optional[int]:
+        """
+        Get the size of the encoded data an image was opened from.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            Size in bytes of the source file, or of the in-memory buffer of
+            an image not loaded yet; None when it cannot be determined
+        """
+        filename = getattr(image, "filename", None)
+        if filename:
+            try:
+                return os.path.getsize(filename)
+            except OSError:
+                pass
+
+        # getbuffer() leaves the stream position alone, which a lazy load
+        # still depends on
+        getbuffer = getattr(getattr(image, "fp", None), "getbuffer", None)
+        if getbuffer is not None:
+            with getbuffer() as view:
+                return view.nbytes
+
+        return None
 
     def _get_compression_params(
         self, format_name: str, quality: int, optimize: bool
-    ) -> dict:
+    ) -> Mapping[str, object]:
         """
         Get format-specific compression parameters.
 
@@ -570,36 +1196,10 @@ class ImageProcessor:
             optimize: Whether to enable optimization
 
         Returns:
-            Dictionary of format-specific parameters
+            Read-only mapping of format-specific parameters, shared between
+            calls with the same arguments
         """
-        params = {}
-
-        if format_name == "JPEG":
-            params.update(
-                {
-                    "quality": quality,
-                    "optimize": optimize,
-                    "progressive": True if quality >= 80 else False,
-                }
-            )
-        elif format_name == "PNG":
-            # PNG compression level (0-9, where 9 is maximum compression)
-            # Map quality (1-100) to compress_level (0-9)
-            compress_level = max(0, min(9, int((100 - quality) / 11)))
-            params.update({"optimize": optimize, "compress_level": compress_level})
-        elif format_name == "WEBP":
-            params.update(
-                {
-                    "quality": quality,
-                    "method": 6,  # Compression method (0-6, 6 is slowest but best)
-                    "optimize": optimize,
-                }
-            )
-        elif format_name in ["GIF", "BMP"]:
-            # These formats have limited compression options
-            params.update({"optimize": optimize})
-
-        return params
+        return _compression_params(format_name, quality, optimize)
 
     def _prepare_image_for_format(
         self, image: Image.Image, target_format: str
@@ -612,10 +1212,17 @@ class ImageProcessor:
             target_format: Target format name
 
         Returns:
-            Image prepared for the target format
+            Image prepared for the target format. This is the source image
+            itself when its mode already suits the format, so callers must
+            not modify it.
         """
-        # Create a copy to avoid modifying the original
-        prepared_image = image.copy()
+        native_modes = _NATIVE_FORMAT_MODES.get(target_format)
+        if native_modes is None or image.mode in native_modes:
+            return image
+
+        # Every conversion below builds a new image, so the source is never
+        # modified and does not need to be copied first
+        prepared_image = image
 
         if target_format == "JPEG":
             # JPEG doesn't support transparency, convert RGBA to RGB
@@ -628,7 +1235,11 @@ class ImageProcessor:
                     background = Image.new("RGB", prepared_image.size, (255, 255, 255))
                     if prepared_image.mode == "LA":
                         prepared_image = prepared_image.convert("RGBA")
-                    background.paste(prepared_image, mask=prepared_image.split()[-1])
+                    # getchannel extracts just the alpha band; split() would
+                    # build all four bands and discard three
+                    background.paste(
+                        prepared_image, mask=prepared_image.getchannel("A")
+                    )
                     prepared_image = background
             elif prepared_image.mode not in ("RGB", "L"):
                 prepared_image = prepared_image.convert("RGB")
@@ -673,16 +1284,42 @@ class ImageProcessor:
             raise ConversionError("Cannot calculate size of None image")
 
         try:
-            buffer = io.BytesIO()
-            save_params = self._get_compression_params(
-                format_name.upper(), quality, True
-            )
-            prepared_image = self._prepare_image_for_format(image, format_name.upper())
-            prepared_image.save(buffer, format=format_name.upper(), **save_params)
-            return buffer.tell()
-        except Exception as e:
+            format_name = self._canonical_format(format_name)
+            save_params = self._get_compression_params(format_name, quality, True)
+            prepared_image = self._prepare_image_for_format(image, format_name)
+            return self._encoded_size(prepared_image, format_name, save_params)
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to calculate image size: {str(e)}")
 
+    def _encoded_size(
+        self,
+        prepared_image: Image.Image,
+        format_name: str,
+        save_params: Mapping[str, object],
+    ) -> int:
+        """
+        Encode a prepared image and return the byte count.
+
+        The encoded data is counted and discarded rather than stored. An
+        encoder that needs to seek in its output falls back to a buffer.
+
+        Args:
+            prepared_image: Image already prepared for the format
+            format_name: Upper-case format to save as
+            save_params: Format-specific save parameters
+
+        Returns:
+            Encoded size in bytes
+        """
+        counter = _ByteCounter()
+        try:
+            prepared_image.save(counter, format=format_name, **save_params)
+            return counter.tell()
+        except io.UnsupportedOperation:
+            with self._scratch_buffer() as buffer:
+                prepared_image.save(buffer, format=format_name, **save_params)
+                return buffer.tell()
+
     def compare_compression_options(
         self,
         image: Image.Image,
@@ -718,7 +1355,7 @@ class ImageProcessor:
                 raise ConversionError(f"Invalid quality level: {quality}")
 
         for fmt in formats:
-            if fmt.upper() not in self.supported_formats:
+            if self._canonical_format(fmt) not in self.supported_formats:
                 raise ConversionError(f"Unsupported format: {fmt}")
 
         try:
@@ -727,33 +1364,33 @@ class ImageProcessor:
                 "comparisons": [],
             }
 
-            for fmt in formats:
-                for quality in quality_levels:
-                    try:
-                        compressed_image, compression_info = self.compress_image(
-                            image, quality, fmt, optimize=True
+            original_size = results["original_size"]
+
+            # Pillow's encoders release the GIL, so the formats are compared
+            # in parallel. Load a lazily opened image before the workers
+            # share it.
+            image.load()
+            max_workers = min(len(formats), os.cpu_count() or 1)
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    format_results = list(
+                        executor.map(
+                            lambda fmt: self._compare_format_options(
+                                image, fmt, quality_levels, original_size
+                            ),
+                            formats,
                         )
+                    )
+            else:
+                format_results = [
+                    self._compare_format_options(
+                        image, fmt, quality_levels, original_size
+                    )
+                    for fmt in formats
+                ]
 
-                        results["comparisons"].append(
-                            {
-                                "format": fmt,
-                                "quality": quality,
-                                "size": compression_info["compressed_size"],
-                                "compression_ratio": compression_info[
-                                    "compression_ratio"
-                                ],
-                                "size_reduction_mb": (
-                                    results["original_size"]
-                                    - compression_info["compressed_size"]
-                                )
-                                / (1024 * 1024),
-                            }
-                        )
-                    except Exception as e:
-                        # Log the error but continue with other combinations
-                        results["comparisons"].append(
-                            {"format": fmt, "quality": quality, "error": str(e)}
-                        )
+            for comparisons in format_results:
+                results["comparisons"].extend(comparisons)
 
             # Sort by file size (smallest first)
             valid_comparisons = [c for c in results["comparisons"] if "error" not in c]
@@ -767,9 +1404,69 @@ class ImageProcessor:
 
             return results
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to compare compression options: {str(e)}")
 
+    def _compare_format_options(
+        self,
+        image: Image.Image,
+        fmt: str,
+        quality_levels: List[int],
+        original_size: int,
+    ) -> List[dict]:
+        """
+        Measure the encoded size of an image in one format at each quality.
+
+        Only the encoded size is needed, so each option is encoded without
+        storing the output and never decoded. Mode conversion does not depend
+        on quality and is done once.
+
+        Args:
+            image: Loaded PIL Image object to analyze
+            fmt: Format to test, as given by the caller
+            quality_levels: Quality levels to test
+            original_size: Size the compression ratios are measured against
+
+        Returns:
+            List of comparison entries, one per quality level
+        """
+        comparisons = []
+        format_name = self._canonical_format(fmt)
+        try:
+            prepared_image = self._prepare_image_for_format(image, format_name)
+            # Image.save stores its parameters on the image, so a worker
+            # must not save an image another worker may be saving
+            if prepared_image is image:
+                prepared_image = image.copy()
+        except _IMAGE_ERRORS as e:
+            for quality in quality_levels:
+                comparisons.append({"format": fmt, "quality": quality, "error": str(e)})
+            return comparisons
+
+        for quality in quality_levels:
+            try:
+                save_params = self._get_compression_params(format_name, quality, True)
+                size = self._encoded_size(prepared_image, format_name, save_params)
+
+                comparisons.append(
+                    {
+                        "format": fmt,
+                        "quality": quality,
+                        "size": size,
+                        "compression_ratio": (
+                            (original_size - size) / original_size * 100
+                            if original_size > 0
+                            else 0
+                        ),
+                        "size_reduction_mb": (original_size - size) / (1024 * 1024),
+                    }
+                )
+            except _IMAGE_ERRORS as e:
+                # Log the error but continue with other combinations
+                comparisons.append({"format": fmt, "quality": quality, "error": str(e)})
+
+        return comparisons
+
     def _generate_compression_recommendations(self, comparisons: List[dict]) -> dict:
         """
         Generate compression recommendations based on comparison results.
@@ -816,6 +1513,7 @@ class ImageProcessor:
         target_format: str,
         quality: int = 85,
         optimize: bool = True,
+        original_size: Optional[int] = None,
     ) -> Tuple[Image.Image, dict]:
         """
         Convert an image to a different format.
@@ -825,35 +1523,114 @@ class ImageProcessor:
             target_format: Target format (PNG, JPEG, WEBP, GIF, BMP)
             quality: Quality setting for lossy formats (1-100)
             optimize: Whether to enable format-specific optimization
+            original_size: Size of the source in bytes, if known
+                (see _get_original_size for the default)
 
         Returns:
             Tuple of (converted_image, conversion_info)
             conversion_info contains: original_format, target_format, size_change
+            The converted image reads its pixels from the encoded data the
+            first time they are accessed, so callers that only need its size,
+            mode or format never decode it.
+
+        Raises:
+            ConversionError: If conversion fails or invalid parameters
+        """
+        converted_bytes, conversion_info = self.convert_to_bytes(
+            image, target_format, quality, optimize, original_size
+        )
+
+        try:
+            # Image.open only parses the header; the image owns its own
+            # buffer, so decoding can wait until the pixels are used
+            return Image.open(io.BytesIO(converted_bytes)), conversion_info
+        except _IMAGE_ERRORS as e:
+            raise ConversionError(f"Failed to load converted image: {str(e)}")
+
+    def convert_to_bytes(
+        self,
+        image: Image.Image,
+        target_format: str,
+        quality: int = 85,
+        optimize: bool = True,
+        original_size: Optional[int] = None,
+    ) -> Tuple[bytes, dict]:
+        """
+        Convert an image to a different format and return the encoded bytes.
+
+        Unlike convert_format, the result is not decoded back into an image.
+
+        Args:
+            image: PIL Image object to convert
+            target_format: Target format (PNG, JPEG, WEBP, GIF, BMP)
+            quality: Quality setting for lossy formats (1-100)
+            optimize: Whether to enable format-specific optimization
+            original_size: Size of the source in bytes, if known
+                (see _get_original_size for the default)
+
+        Returns:
+            Tuple of (converted_bytes, conversion_info)
+
+        Raises:
+            ConversionError: If conversion fails or invalid parameters
+        """
+        with self._scratch_buffer() as converted_buffer:
+            conversion_info = self._convert_into(
+                converted_buffer,
+                image,
+                target_format,
+                quality,
+                optimize,
+                original_size=original_size,
+            )
+            return converted_buffer.getvalue(), conversion_info
+
+    def _convert_into(
+        self,
+        converted_buffer: io.BytesIO,
+        image: Image.Image,
+        target_format: str,
+        quality: int,
+        optimize: bool,
+        original_size: Optional[int] = None,
+    ) -> dict:
+        """
+        Validate conversion arguments and encode the image into a buffer.
+
+        Args:
+            converted_buffer: Empty buffer that receives the encoded image
+            image: PIL Image object to convert
+            target_format: Target format (PNG, JPEG, WEBP, GIF, BMP)
+            quality: Quality setting for lossy formats (1-100)
+            optimize: Whether to enable format-specific optimization
+            original_size: Size of the source in bytes, if known
+
+        Returns:
+            Conversion info dictionary
 
         Raises:
             ConversionError: If conversion fails or invalid parameters
         """
+
         if image is None:
             raise ConversionError("Cannot convert format of None image")
 
         if not (1 <= quality <= 100):
             raise ConversionError("Quality must be between 1 and 100")
 
-        target_format = target_format.upper()
+        target_format = self._canonical_format(target_format)
         if target_format not in self.supported_formats:
-            supported_list = ", ".join(sorted(self.supported_formats))
             raise ConversionError(
                 f"Unsupported target format '{target_format}'. "
-                f"Supported formats: {supported_list}"
+                f"Supported formats: {self._supported_formats_list}"
             )
 
         try:
             original_format = image.format or "PNG"
 
-            # Get original size
-            original_buffer = io.BytesIO()
-            image.save(original_buffer, format=original_format)
-            original_size = original_buffer.tell()
+            # Get original size without re-encoding the image
+            if original_size is None:
+                original_size = self._get_original_size(image)
 
             # Prepare image for target format
             converted_image = self._prepare_image_for_format(image, target_format)
@@ -861,10 +1638,33 @@ class ImageProcessor:
             # Get format-specific parameters
             save_params = self._get_compression_params(target_format, quality, optimize)
 
-            # Convert to target format
-            converted_buffer = io.BytesIO()
-            converted_image.save(converted_buffer, format=target_format, **save_params)
+            # Convert to target format. Uncompressed output is about the
+            # size of the raw pixels, so reserve that much up front rather
+            # than letting the buffer regrow as the encoder writes.
+            if (
+                SIMPLEJPEG_AVAILABLE
+                and target_format == "JPEG"
+                and not optimize
+                and converted_image.mode == "RGB"
+            ):
+                # simplejpeg writes baseline JPEGs only, so it is used when
+                # optimization (including progressive encoding) is off
+                converted_buffer.write(
+                    simplejpeg.encode_jpeg(
+                        np.asarray(converted_image),
+                        quality=quality,
+                        colorspace="RGB",
+                        colorsubsampling="444" if quality >= 90 else "420",
+                    )
+                )
+            else:
+                if target_format in _UNCOMPRESSED_FORMATS:
+                    self._reserve_buffer(converted_buffer, converted_image)
+                converted_image.save(
+                    converted_buffer, format=target_format, **save_params
+                )
             converted_size = converted_buffer.tell()
+            converted_buffer.truncate()
 
             # Calculate size change
             size_change = converted_size - original_size
@@ -884,16 +1684,99 @@ class ImageProcessor:
                 "optimized": optimize,
             }
 
-            # Load converted image from buffer for return
-            converted_buffer.seek(0)
-            result_image = Image.open(converted_buffer)
-            result_image.load()  # Ensure image data is loaded
-
-            return result_image, conversion_info
+            return conversion_info
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to convert image format: {str(e)}")
 
+    def _reserve_buffer(self, buffer: io.BytesIO, image: Image.Image) -> None:
+        """
+        Grow an empty buffer to fit the image's raw pixel data.
+
+        The reserved space is overwritten by the next write; callers
+        truncate the buffer once writing is done.
+
+        Args:
+            buffer: Empty buffer positioned at the start
+            image: Image whose raw size is reserved
+        """
+        # Allow for row padding and headers or a palette
+        reserved = (
+            image.width * image.height * len(image.getbands())
+            + image.height * 4
+            + self.BUFFER_RESERVE_SLACK
+        )
+        buffer.write(bytes(reserved))
+        buffer.seek(0)
+
+    def _unchanged_conversion_info(self, image: Image.Image, quality: int) -> dict:
+        """
+        Build conversion info for an image kept in its current format.
+
+        Args:
+            image: PIL Image object that was not re-encoded
+            quality: Requested quality setting
+
+        Returns:
+            Conversion info dictionary with no size change. The sizes are
+            the source's encoded size, or None when it is not known.
+        """
+        original_size = self._get_source_size(image)
+        return {
+            "original_format": image.format,
+            "target_format": image.format,
+            "original_size": original_size,
+            "converted_size": original_size,
+            "size_change": 0,
+            "size_change_percent": 0,
+            "quality": quality,
+            "optimized": False,
+        }
+
+    def orient_image(
+        self,
+        image: Image.Image,
+        angle: int = 0,
+        flip_horizontal: bool = False,
+        flip_vertical: bool = False,
+    ) -> Image.Image:
+        """
+        Rotate an image clockwise and then flip it, in a single pass.
+
+        Every combination of a quarter-turn rotation and flips is one of
+        PIL's transpose operations, so at most one transpose is made.
+
+        Args:
+            image: PIL Image object to orient
+            angle: Clockwise rotation angle in degrees (0, 90, 180, 270)
+            flip_horizontal: Whether to flip horizontally after rotating
+            flip_vertical: Whether to flip vertically after rotating
+
+        Returns:
+            Oriented PIL Image object, or the given image itself when the
+            combination leaves it unchanged
+
+        Raises:
+            ConversionError: If the angle is invalid or the transpose fails
+        """
+        if image is None:
+            raise ConversionError("Cannot orient None image")
+
+        try:
+            orientation = _ORIENTATION_TRANSPOSES[
+                (angle, bool(flip_horizontal), bool(flip_vertical))
+            ]
+        except KeyError:
+            raise ConversionError("Rotation angle must be 0, 90, 180, or 270 degrees")
+
+        if orientation is None:
+            return image
+
+        try:
+            return image.transpose(orientation)
+        except _IMAGE_ERRORS as e:
+            raise ConversionError(f"Failed to orient image: {str(e)}")
+
     def rotate_image(
         self, image: Image.Image, angle: int, expand: bool = True
     ) -> Image.Image:
@@ -928,7 +1811,7 @@ class ImageProcessor:
 
             return rotated_image
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to rotate image: {str(e)}")
 
     def flip_image(self, image: Image.Image, direction: str) -> Image.Image:
@@ -957,17 +1840,17 @@ class ImageProcessor:
             )
 
         try:
-            flipped_image = image.copy()
-
-            if direction in ["horizontal", "both"]:
-                flipped_image = flipped_image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-
-            if direction in ["vertical", "both"]:
-                flipped_image = flipped_image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+            # A single transpose returns a new image, so no copy is needed;
+            # flipping both ways is a 180 degree rotation
+            flipped_image = image.transpose(
+                _ORIENTATION_TRANSPOSES[
+                    (0, direction != "vertical", direction != "horizontal")
+                ]
+            )
 
             return flipped_image
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to flip image: {str(e)}")
 
     def apply_processing_options(
@@ -1023,28 +1906,40 @@ class ImageProcessor:
         self.validate_processing_options(options)
 
         try:
-            processed_image = image.copy()
+            # Each step returns a new image, so the input is only copied at
+            # the end if no step replaced it
+            processed_image = image
+            operations = []
             processing_info = {
-                "operations": [],
+                "operations": operations,
                 "original_size": image.size,
                 "original_format": image.format or "PNG",
             }
+            record = self.record_operations
+
+            # 1-2. Apply rotation and flipping as a single transpose
+            processed_image = self.orient_image(
+                processed_image,
+                options.rotation_angle,
+                options.flip_horizontal,
+                options.flip_vertical,
+            )
 
-            # 1. Apply rotation first (affects dimensions)
-            if options.rotation_angle != 0:
-                processed_image = self.rotate_image(
-                    processed_image, options.rotation_angle
-                )
-                processing_info["operations"].append(
+            if record and options.rotation_angle != 0:
+                width, height = image.size
+                operations.append(
                     {
                         "operation": "rotate",
                         "angle": options.rotation_angle,
-                        "new_size": processed_image.size,
+                        "new_size": (
+                            (height, width)
+                            if options.rotation_angle in (90, 270)
+                            else (width, height)
+                        ),
                     }
                 )
 
-            # 2. Apply flipping
-            if options.flip_horizontal or options.flip_vertical:
+            if record and (options.flip_horizontal or options.flip_vertical):
                 if options.flip_horizontal and options.flip_vertical:
                     direction = "both"
                 elif options.flip_horizontal:
@@ -1052,10 +1947,7 @@ class ImageProcessor:
                 else:
                     direction = "vertical"
 
-                processed_image = self.flip_image(processed_image, direction)
-                processing_info["operations"].append(
-                    {"operation": "flip", "direction": direction}
-                )
+                operations.append({"operation": "flip", "direction": direction})
 
             # 3. Apply resizing (after rotation/flip to work with final orientation)
             if options.resize_width is not None or options.resize_height is not None:
@@ -1064,44 +1956,64 @@ class ImageProcessor:
                     width=options.resize_width,
                     height=options.resize_height,
                     maintain_aspect=options.maintain_aspect_ratio,
+                    resize_quality=options.resize_quality,
                 )
-                processing_info["operations"].append(
-                    {
-                        "operation": "resize",
-                        "width": options.resize_width,
-                        "height": options.resize_height,
-                        "maintain_aspect": options.maintain_aspect_ratio,
-                        "new_size": processed_image.size,
-                    }
-                )
+                if record:
+                    operations.append(
+                        {
+                            "operation": "resize",
+                            "width": options.resize_width,
+                            "height": options.resize_height,
+                            "maintain_aspect": options.maintain_aspect_ratio,
+                            "new_size": processed_image.size,
+                        }
+                    )
 
             # 4. Apply format conversion and compression (last step)
             if options.target_format is not None:
-                processed_image, conversion_info = self.convert_format(
-                    processed_image,
-                    options.target_format,
-                    quality=options.quality,
-                    optimize=True,
-                )
-                processing_info["operations"].append(
-                    {
-                        "operation": "convert_format",
-                        "target_format": options.target_format,
-                        "quality": options.quality,
-                        "conversion_info": conversion_info,
-                    }
-                )
-            elif options.quality != 85:  # Apply compression if quality is not default
+                if (
+                    processed_image.format is not None
+                    and self._canonical_format(options.target_format)
+                    == processed_image.format
+                    and options.quality == self.DEFAULT_QUALITY
+                ):
+                    # The untouched source is already in the target format,
+                    # so re-encoding it would only degrade it
+                    conversion_info = self._unchanged_conversion_info(
+                        processed_image, options.quality
+                    )
+                else:
+                    processed_image, conversion_info = self.convert_format(
+                        processed_image,
+                        options.target_format,
+                        quality=options.quality,
+                        optimize=True,
+                    )
+                if record:
+                    operations.append(
+                        {
+                            "operation": "convert_format",
+                            "target_format": options.target_format,
+                            "quality": options.quality,
+                            "conversion_info": conversion_info,
+                        }
+                    )
+            elif options.quality != self.DEFAULT_QUALITY:
+                # Apply compression if quality is not default
                 processed_image, compression_info = self.compress_image(
                     processed_image, quality=options.quality, optimize=True
                 )
-                processing_info["operations"].append(
-                    {
-                        "operation": "compress",
-                        "quality": options.quality,
-                        "compression_info": compression_info,
-                    }
-                )
+                if record:
+                    operations.append(
+                        {
+                            "operation": "compress",
+                            "quality": options.quality,
+                            "compression_info": compression_info,
+                        }
+                    )
+
+            if processed_image is image:
+                processed_image = image.copy()
 
             processing_info["final_size"] = processed_image.size
             processing_info["final_format"] = (
@@ -1110,5 +2022,48 @@ class ImageProcessor:
 
             return processed_image, processing_info
 
-        except Exception as e:
+        except _IMAGE_ERRORS as e:
             raise ConversionError(f"Failed to apply processing options: {str(e)}")
+
+    def apply_processing_options_batch(
+        self, images: List[Image.Image], options: ProcessingOptions
+    ) -> List[Tuple[Image.Image, dict]]:
+        """
+        Apply the same processing options to several images.
+
+        The options are validated once and the images are processed on a
+        thread pool, since Pillow releases the GIL while transforming and
+        encoding pixel data.
+
+        Args:
+            images: PIL Image objects to process
+            options: ProcessingOptions applied to every image
+
+        Returns:
+            List of (processed_image, processing_info), in input order
+
+        Raises:
+            ConversionError: If any image fails to process or invalid options
+        """
+        if any(image is None for image in images):
+            raise ConversionError("Cannot process None image")
+
+        if options is not None:
+            self.validate_processing_options(options)
+
+        # Saving an image stores its parameters on it, so an image listed
+        # twice must not be processed by two threads at once
+        max_workers = min(len(images), os.cpu_count() or 1)
+        if len({id(image) for image in images}) != len(images):
+            max_workers = 1
+
+        if max_workers <= 1:
+            return [self.apply_processing_options(image, options) for image in images]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda image: self.apply_processing_options(image, options),
+                    images,
+                )
+            )
@@ -453,6 +453,10 @@ class StructuredLogger:
         with self.operation_lock:
             self.operation_times.clear()
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at the given level would be processed."""
+        return self.logger.isEnabledFor(level)
+
     def _log_with_context(
         self,
         level: int,
@@ -475,6 +479,16 @@ class StructuredLogger:
 
         self.logger.log(level, message, extra=extra, exc_info=exc_info)
 
+    def log(
+        self,
+        level: int,
+        message: str,
+        context: Optional[LogContext] = None,
+        **kwargs,
+    ):
+        """Log message at the given numeric level."""
+        self._log_with_context(level, message, context, **kwargs)
+
     def trace(self, message: str, context: Optional[LogContext] = None, **kwargs):
         """Log trace message."""
         self._log_with_context(LogLevel.TRACE.value, message, context, **kwargs)
@@ -20,6 +20,8 @@ class ProcessingOptions:
         rotation_angle: Rotation angle in degrees (0, 90, 180, 270)
         flip_horizontal: Whether to flip image horizontally
         flip_vertical: Whether to flip image vertically
+        resize_quality: Resize filter: "lanczos" (best), "fast" (box
+            reduction before LANCZOS on large downscales) or "box"
     """
 
     resize_width: Optional[int] = None
@@ -30,6 +32,7 @@ class ProcessingOptions:
     rotation_angle: int = 0
     flip_horizontal: bool = False
     flip_vertical: bool = False
+    resize_quality: str = "lanczos"
 
     def __post_init__(self):
         """Validate processing options after initialization."""
@@ -48,6 +51,10 @@ class ProcessingOptions:
         if self.resize_height is not None and self.resize_height <= 0:
             raise ValueError("Resize height must be positive")
 
+        # Validate resize quality
+        if self.resize_quality not in ("lanczos", "fast", "box"):
+            raise ValueError("Resize quality must be 'lanczos', 'fast', or 'box'")
+
         # Validate target format
         if self.target_format is not None:
             valid_formats = {"PNG", "JPEG", "WEBP", "GIF", "BMP"}
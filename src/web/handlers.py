@@ -559,6 +559,7 @@ class WebHandlers:
                 rotation_angle=options_data.get("rotation_angle", 0),
                 flip_horizontal=options_data.get("flip_horizontal", False),
                 flip_vertical=options_data.get("flip_vertical", False),
+                resize_quality=options_data.get("resize_quality", "lanczos"),
             )
         except Exception as e:
             raise ValidationError(f"잘못된 처리 옵션: {str(e)}")
@@ -587,6 +588,7 @@ class WebHandlers:
             "rotation_angle": options.rotation_angle,
             "flip_horizontal": options.flip_horizontal,
             "flip_vertical": options.flip_vertical,
+            "resize_quality": options.resize_quality,
         }
 
     def _validate_base64_data(self, base64_data: str) -> bool:
@@ -0,0 +1,166 @@
+"""
+Tests for where ErrorHandler writes error records, and when.
+
+Under the default logger setup, error records are appended to the NDJSON
+error log and shown on the console, but kept out of the text log file.
+High severity records reach the NDJSON file at once; lower severities wait
+for the periodic flush. Other ERROR messages reach the text log at once.
+"""
+
+import json
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core import error_handler as error_handler_module
+from src.core.error_handler import ErrorHandler, ErrorSeverity
+from src.domain.exceptions.security import SecurityError
+from src.domain.exceptions.validation import UnsupportedFormatError
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler that keeps the messages it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _wait_for(condition, timeout=2.0):
+    """Poll until condition() is true, as the log listener is asynchronous."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _read(path):
+    """Read a log file as it is on disk."""
+    with open(path, encoding="utf-8") as log_file:
+        return log_file.read()
+
+
+@pytest.fixture
+def default_logging(tmp_path, monkeypatch):
+    """
+    Install the default logger setup and observe its console output.
+
+    The setup is shared by the whole process; if no earlier test installed
+    it, its log files are created under tmp_path.
+
+    Returns:
+        Tuple of (ErrorHandler, text log path, NDJSON log path, collector)
+    """
+    monkeypatch.chdir(tmp_path)
+    handler = ErrorHandler()
+
+    listener = error_handler_module._logger_queue_listener
+    collector = _CollectingHandler()
+    monkeypatch.setattr(listener, "handlers", listener.handlers + (collector,))
+
+    # The buffered file handler wraps the FileHandler of the text log
+    text_log_path = next(
+        h.target.baseFilename
+        for h in listener.handlers
+        if isinstance(h, logging.handlers.MemoryHandler)
+    )
+    # The NDJSON log sits next to it, opened by a path relative to the
+    # directory the setup ran in
+    ndjson_log_path = Path(text_log_path).with_name(
+        Path(error_handler_module._ndjson_log_file.name).name
+    )
+    return handler, text_log_path, ndjson_log_path, collector
+
+
+def _raised(exception):
+    """Raise and catch an exception, so that it carries a traceback."""
+    try:
+        raise exception
+    except Exception as caught:
+        return caught
+
+
+def _log_marker(level):
+    """Log a unique plain message through the error handler's logger."""
+    marker = f"marker {uuid.uuid4().hex}"
+    logging.getLogger("image_converter.error_handler").log(level, marker)
+    return marker
+
+
+def test_high_severity_error_reaches_ndjson_log_at_once(default_logging):
+    """A HIGH error is on disk in the NDJSON log as soon as it is handled."""
+    handler, text_log_path, ndjson_log_path, collector = default_logging
+
+    # Error ids restart with each ErrorHandler, so records are told apart
+    # by a token in their message
+    token = uuid.uuid4().hex
+    context = handler.handle_error(_raised(SecurityError(f"blocked {token}")))
+    assert context.severity == ErrorSeverity.HIGH
+
+    records = [json.loads(line) for line in _read(ndjson_log_path).splitlines()]
+    record = next(r for r in records if token in r["technical_message"])
+    assert record["severity"] == "high"
+    assert record["error_id"] == context.error_id
+    assert "SecurityError" in record["stack_trace"]
+
+    # It is shown on the console, but not written to the text log as well
+    assert _wait_for(lambda: any(token in message for message in collector.messages))
+    marker = _log_marker(logging.ERROR)
+    assert _wait_for(lambda: marker in _read(text_log_path))
+    assert token not in _read(text_log_path)
+
+
+def test_low_severity_error_waits_for_flush(default_logging):
+    """A LOW error is buffered until the NDJSON log is flushed."""
+    handler, text_log_path, ndjson_log_path, collector = default_logging
+
+    token = uuid.uuid4().hex
+    context = handler.handle_error(UnsupportedFormatError(token, ".xyz"))
+    assert context.severity == ErrorSeverity.LOW
+    assert token not in _read(ndjson_log_path)
+
+    error_handler_module._ndjson_log_file.flush()
+    assert token in _read(ndjson_log_path)
+
+    assert _wait_for(lambda: any(token in message for message in collector.messages))
+    assert token not in _read(text_log_path)
+
+
+def test_error_message_reaches_text_log_at_once(default_logging):
+    """ERROR messages that are not error records are written immediately."""
+    _, text_log_path, _, collector = default_logging
+
+    marker = _log_marker(logging.ERROR)
+
+    assert _wait_for(lambda: marker in _read(text_log_path))
+    assert marker in collector.messages
+
+
+def test_injected_logger_receives_error_records():
+    """An injected logger gets every error record as an ordinary record."""
+    logger = logging.getLogger(f"test_error_logging.{uuid.uuid4().hex}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    collector = _CollectingHandler()
+    logger.addHandler(collector)
+
+    handler = ErrorHandler(logger=logger)
+    high = handler.handle_error(SecurityError("blocked upload"))
+    low = handler.handle_error(UnsupportedFormatError("unknown format", ".xyz"))
+    assert high.severity == ErrorSeverity.HIGH
+    assert low.severity == ErrorSeverity.LOW
+
+    assert any(high.error_id in message for message in collector.messages)
+    assert any(low.error_id in message for message in collector.messages)
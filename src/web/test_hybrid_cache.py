@@ -0,0 +1,155 @@
+"""
+Tests for the two-layer HybridCacheManager.
+
+These tests check that the in-process L1 layer honours entry lifetimes and
+invalidation, that reads skip a failing primary backend, and that result
+reads are hedged against a slow remote primary.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.factories.cache_factory import CacheFactory, HybridCacheManager
+
+
+class _StubCache:
+    """Minimal backend that serves fixed values and counts reads."""
+
+    def __init__(self, value=None, fail=False, delay=0, backend_type="memory"):
+        self.value = value
+        self.fail = fail
+        self.delay = delay
+        self.backend_type = backend_type
+        self.reads = 0
+
+    def get(self, key):
+        self.reads += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("backend unavailable")
+        return self.value
+
+    def get_cached_result(self, cache_key):
+        return self.get(cache_key)
+
+    def set(self, key, value, ttl=None):
+        return True
+
+
+def _memory_hybrid_cache():
+    """Build a hybrid cache over two fresh memory caches."""
+    CacheFactory.clear_instance_cache()
+    factory = CacheFactory()
+    primary = factory.create_memory_cache(max_entries=10)
+    fallback = factory.create_memory_cache(max_entries=20)
+    return HybridCacheManager(primary, fallback)
+
+
+def test_entry_expires_after_ttl():
+    """An entry set with a ttl is gone, L1 included, once the ttl passes."""
+    cache = _memory_hybrid_cache()
+
+    cache.set("key", "value", ttl=1)
+    assert cache.get("key") == "value"
+
+    time.sleep(1.2)
+    assert cache.get("key") is None
+
+
+def test_invalidate_evicts_l1():
+    """Invalidating a key drops the copy served from L1."""
+    cache = _memory_hybrid_cache()
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.get_cache_stats()["hybrid_stats"]["l1_hits"] >= 1
+
+    assert cache.invalidate("key")
+    assert cache.get("key") is None
+
+
+def test_breaker_skips_primary_during_cooldown():
+    """After a primary failure, reads use the fallback until cooldown ends."""
+    primary = _StubCache(fail=True)
+    fallback = _StubCache(value="fallback")
+    cache = HybridCacheManager(primary, fallback)
+
+    assert cache.get("first") == "fallback"
+    assert primary.reads == 1
+
+    # A different key misses L1, so this read reaches the backends
+    assert cache.get("second") == "fallback"
+    assert cache.get_cached_result("third") == "fallback"
+    assert primary.reads == 1
+    assert fallback.reads == 3
+
+    # Once the cooldown has passed, the primary is probed again
+    cache._primary_retry_at = time.monotonic()
+    primary.fail = False
+    primary.value = "primary"
+    assert cache.get("fourth") == "primary"
+    assert primary.reads == 2
+
+
+def test_hedge_returns_fallback_when_remote_primary_is_slow():
+    """A slow remote primary loses the race to the fallback."""
+    primary = _StubCache(value="primary", delay=0.5, backend_type="redis")
+    fallback = _StubCache(value="fallback")
+    cache = HybridCacheManager(primary, fallback, hedge_delay=0.01)
+
+    started = time.monotonic()
+    assert cache.get_cached_result("key") == "fallback"
+    assert time.monotonic() - started < 0.4
+
+    # Losing the race is not a primary failure
+    stats = cache.get_cache_stats()["hybrid_stats"]
+    assert stats["primary_failures"] == 0
+
+
+def test_in_process_primary_is_not_hedged():
+    """An in-process primary is read on the calling thread, however slow."""
+    primary = _StubCache(value="primary", delay=0.05)
+    fallback = _StubCache(value="fallback")
+    cache = HybridCacheManager(primary, fallback, hedge_delay=0.01)
+
+    assert cache.get_cached_result("key") == "primary"
+    assert fallback.reads == 0
+
+
+def test_hedge_keeps_fallback_latency_under_concurrent_slow_reads():
+    """Reads beyond the hedge workers still get the fallback quickly."""
+    primary = _StubCache(value="primary", delay=1.0, backend_type="redis")
+    fallback = _StubCache(value="fallback")
+    cache = HybridCacheManager(primary, fallback, hedge_delay=0.01)
+
+    latencies = []
+    results = []
+
+    def read(key):
+        started = time.monotonic()
+        results.append(cache.get_cached_result(key))
+        latencies.append(time.monotonic() - started)
+
+    readers = [
+        threading.Thread(target=read, args=(f"key-{index}",))
+        for index in range(2 * HybridCacheManager.HEDGE_POOL_WORKERS)
+    ]
+    for reader in readers:
+        reader.start()
+
+    # Writes do not queue behind the abandoned primary lookups
+    started = time.monotonic()
+    assert cache.set("other", "value")
+    assert time.monotonic() - started < 0.5
+
+    for reader in readers:
+        reader.join()
+
+    assert results == ["fallback"] * len(readers)
+    assert max(latencies) < 0.5
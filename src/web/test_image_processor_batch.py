@@ -0,0 +1,93 @@
+"""
+Tests for the ImageProcessor batch and single-pass helpers.
+
+These tests check that compress_batch, apply_processing_options_batch and
+orient_image give the same results as the single-image operations they
+replace.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.image_processor import ImageProcessor
+from src.models.processing_options import ProcessingOptions
+
+
+def _sample_images():
+    """Build a few small images with different modes and shapes."""
+    gradient = Image.linear_gradient("L").resize((33, 21))
+    return [
+        Image.new("RGB", (40, 30), (10, 200, 30)),
+        gradient.convert("RGBA"),
+        gradient,
+    ]
+
+
+def test_compress_batch_matches_compress_image():
+    """Each batch result matches compress_image on the same image."""
+    processor = ImageProcessor()
+    images = _sample_images()
+
+    for target_format in ("JPEG", "PNG", "WEBP"):
+        results = processor.compress_batch(
+            images, quality=70, target_format=target_format
+        )
+        assert len(results) == len(images)
+
+        for image, (data, info) in zip(images, results):
+            single_image, single_info = processor.compress_image(
+                image, quality=70, target_format=target_format
+            )
+            assert info == single_info
+            assert len(data) == info["compressed_size"]
+            assert Image.open(io.BytesIO(data)).tobytes() == single_image.tobytes()
+
+
+def test_apply_processing_options_batch_matches_single_calls():
+    """Each batch result matches apply_processing_options on the same image."""
+    processor = ImageProcessor()
+    images = _sample_images()
+    options = ProcessingOptions(
+        resize_width=20,
+        rotation_angle=90,
+        flip_horizontal=True,
+        target_format="PNG",
+    )
+
+    # The repeated image exercises the serial path for shared inputs
+    batch = images + [images[0]]
+    results = processor.apply_processing_options_batch(batch, options)
+    assert len(results) == len(batch)
+
+    for image, (processed, info) in zip(batch, results):
+        single_image, single_info = processor.apply_processing_options(image, options)
+        assert info == single_info
+        assert processed.size == single_image.size
+        assert processed.tobytes() == single_image.tobytes()
+
+
+def test_orient_image_matches_rotate_then_flip():
+    """orient_image equals rotate_image followed by flip_image."""
+    processor = ImageProcessor()
+    image = _sample_images()[0]
+
+    for angle in (0, 90, 180, 270):
+        for flip_horizontal in (False, True):
+            for flip_vertical in (False, True):
+                expected = processor.rotate_image(image, angle, expand=True)
+                if flip_horizontal:
+                    expected = processor.flip_image(expected, "horizontal")
+                if flip_vertical:
+                    expected = processor.flip_image(expected, "vertical")
+
+                oriented = processor.orient_image(
+                    image, angle, flip_horizontal, flip_vertical
+                )
+                assert oriented.size == expected.size
+                assert oriented.tobytes() == expected.tobytes()
@@ -0,0 +1,52 @@
+"""
+Tests for processing options on the web image processing path.
+
+These tests check that options parsed by the web interface take effect
+when _process_image_with_options processes an image.
+"""
+
+import base64
+import io
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.models.processing_options import ProcessingOptions
+from src.web import web_app
+
+
+def _process_with_resize_quality(image_path, resize_quality):
+    """Resize the image through the web path and return the decoded result."""
+    # 30 / 7 is not an integer, so "box" goes through resize() rather than
+    # reduce()
+    options = ProcessingOptions(
+        resize_width=7, target_format="PNG", resize_quality=resize_quality
+    )
+    result = web_app._process_image_with_options(str(image_path), options)
+
+    assert result.success, result.error_message
+    return Image.open(io.BytesIO(base64.b64decode(result.base64_data)))
+
+
+def test_resize_quality_changes_resample_filter(tmp_path):
+    """A non-default resize_quality selects a different resample filter."""
+    source = Image.linear_gradient("L").resize((30, 20))
+    image_path = tmp_path / "source.png"
+    source.save(image_path, "PNG")
+
+    default_result = _process_with_resize_quality(image_path, "lanczos")
+    box_result = _process_with_resize_quality(image_path, "box")
+
+    size = default_result.size
+    assert size[0] == 7
+    assert box_result.size == size
+
+    lanczos = source.resize(size, Image.Resampling.LANCZOS)
+    box = source.resize(size, Image.Resampling.BOX)
+    assert lanczos.tobytes() != box.tobytes()
+    assert default_result.tobytes() == lanczos.tobytes()
+    assert box_result.tobytes() == box.tobytes()
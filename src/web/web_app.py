@@ -129,6 +129,7 @@ def batch_start():
                 rotation_angle=options_data.get("rotation_angle", 0),
                 flip_horizontal=options_data.get("flip_horizontal", False),
                 flip_vertical=options_data.get("flip_vertical", False),
+                resize_quality=options_data.get("resize_quality", "lanczos"),
             )
         except ValueError as e:
             return jsonify({"error": f"잘못된 처리 옵션: {str(e)}"}), 400
@@ -537,22 +538,13 @@ def _process_image_with_options(
             # 원본 이미지 객체를 직접 사용 (PIL 연산은 어차피 새 이미지를 반환함)
             processed_image = image
 
-            # 회전 적용
-            if options.rotation_angle != 0:
-                processed_image = image_processor.rotate_image(
-                    processed_image, options.rotation_angle
-                )
-
-            # 뒤집기 적용
-            if options.flip_horizontal:
-                processed_image = image_processor.flip_image(
-                    processed_image, "horizontal"
-                )
-
-            if options.flip_vertical:
-                processed_image = image_processor.flip_image(
-                    processed_image, "vertical"
-                )
+            # 회전 및 뒤집기 적용 (단일 transpose 연산으로 처리)
+            processed_image = image_processor.orient_image(
+                processed_image,
+                options.rotation_angle,
+                options.flip_horizontal,
+                options.flip_vertical,
+            )
 
             # 리사이징 적용
             if options.resize_width or options.resize_height:
@@ -561,6 +553,7 @@ def _process_image_with_options(
                     width=options.resize_width,
                     height=options.resize_height,
                     maintain_aspect=options.maintain_aspect_ratio,
+                    resize_quality=options.resize_quality,
                 )
 
             # 포맷 변환 및 압축을 한 번에 처리 (Optimized)
@@ -579,7 +572,10 @@ def _process_image_with_options(
 
             # Base64 인코딩 (메모리 뷰 사용 및 ascii 디코딩으로 최적화)
             # getbuffer()는 복사를 피하고, ascii 디코딩은 utf-8보다 빠름
-            base64_data = base64.b64encode(img_buffer.getbuffer()).decode("ascii")
+            # 버퍼와 메모리 뷰는 with 블록을 벗어나는 즉시 해제됨
+            with img_buffer, img_buffer.getbuffer() as encoded_view:
+                base64_data = base64.b64encode(encoded_view).decode("ascii")
+                file_size = encoded_view.nbytes
 
             # 결과 생성
             result = ConversionResult(
@@ -588,7 +584,7 @@ def _process_image_with_options(
                 base64_data=base64_data,
                 format=target_format,
                 size=processed_image.size,
-                file_size=img_buffer.getbuffer().nbytes,
+                file_size=file_size,
             )
 
             return result